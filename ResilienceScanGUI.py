@@ -12,24 +12,30 @@ Features:
 
 import tkinter as tk
 from tkinter import ttk, scrolledtext, messagebox, filedialog
+import functools
+import numpy as np
 import pandas as pd
 import os
+import re
 import subprocess
 import threading
+import time
 import queue
+from collections import deque
+from operator import itemgetter
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
 from pathlib import Path
 from datetime import datetime
+import atexit
 import json
 import sys
 
 # Import email tracking system
 from email_tracker import EmailTracker
 
-# Import system checker
-from gui_system_check import SystemChecker
-
-# Import dependency manager
-from dependency_manager import DependencyManager
+# SystemChecker and DependencyManager are imported lazily at their single
+# call sites (run_system_check / install_linux_dependencies) so the window
+# paints without paying for modules most sessions never use
 
 # Configuration
 ROOT_DIR = Path(__file__).resolve().parent
@@ -38,6 +44,267 @@ REPORTS_DIR = ROOT_DIR / "reports"
 TEMPLATE = ROOT_DIR / "ResilienceReport.qmd"
 CONFIG_FILE = ROOT_DIR / "config.yml"
 LOG_FILE = ROOT_DIR / "gui_log.txt"
+STATS_CACHE_FILE = ROOT_DIR / ".gui_stats.json"
+
+# Bound the in-widget log history so multi-hour runs don't grow unbounded
+MAX_LOG_LINES = 5000
+
+# Page size for the windowed email-status list
+EMAIL_TREE_PAGE = 200
+
+# Page size for the windowed data-preview list
+DATA_TREE_PAGE = 500
+
+# Rows inserted per event-loop turn when filling a preview page
+DATA_INSERT_CHUNK = 50
+
+# How much of the log file to load into the viewer on a fresh refresh
+LOG_TAIL_BYTES = 256 * 1024
+
+# Concurrent email sends (SMTP/Outlook is I/O-bound)
+EMAIL_SEND_WORKERS = 8
+
+# Let latexmk drive the LaTeX rerun heuristic (converges in ~2 passes
+# instead of quarto's fixed xelatex loop), keeping xelatex as the engine
+QUARTO_PDF_ENGINE_ARGS = ['-M', 'pdf-engine:latexmk', '-M', 'pdf-engine-opt:-xelatex']
+
+# One C-level tuple fetch per email row instead of four dict lookups
+_email_row_getter = itemgetter('company', 'person', 'email', 'status')
+
+# Placeholders the email templates may use; anything else is left literal
+# by _SafeDict and flagged once at send-start
+TEMPLATE_FIELD_RE = re.compile(r'\{(\w+)\}')
+TEMPLATE_FIELDS = frozenset({'company', 'name', 'date'})
+
+
+class _SafeDict(dict):
+    """format_map helper: unknown placeholders render as themselves
+    instead of raising KeyError mid-send"""
+
+    def __missing__(self, key):
+        return '{' + key + '}'
+
+# Explicit dtypes for the columns the GUI works with, keyed by normalized
+# (lowercased/stripped) header name. Spelling them out skips pandas'
+# type-inference pass and keeps these columns string-typed even when nulls
+# appear. Low-cardinality columns (one company per many respondents) are
+# categorical, so repeated values share one interned string. Remaining
+# columns still get inferred types.
+CSV_DTYPES = {
+    'company_name': 'category',
+    'name': 'string',
+    'email_address': 'string',
+    'sector': 'category',
+}
+PARSE_DATES = ['submitdate']
+
+# Columns a data file must provide to be usable (matches clean_data.py)
+REQUIRED_CSV_COLUMNS = {'company_name', 'name'}
+
+
+def _load_master_with_cache(csv_path):
+    """Load a master CSV, using a Parquet cache when the CSV is unchanged.
+
+    The first load writes a ``.parquet`` file next to the CSV together with
+    a ``.meta.json`` sidecar recording the CSV's mtime/size. Subsequent
+    loads read the Parquet file instead, skipping the CSV parse and
+    type-inference pass entirely. Falls back to a plain CSV read when
+    pyarrow is not installed.
+    """
+    csv_path = Path(csv_path)
+    parquet_path = csv_path.with_suffix('.parquet')
+    meta_path = csv_path.with_suffix('.meta.json')
+    stat = csv_path.stat()
+
+    try:
+        import pyarrow  # noqa: F401
+        have_pyarrow = True
+    except ImportError:
+        have_pyarrow = False
+
+    if have_pyarrow and parquet_path.exists() and meta_path.exists():
+        try:
+            meta = json.loads(meta_path.read_text())
+            if meta.get('mtime') == stat.st_mtime and meta.get('size') == stat.st_size:
+                return pd.read_parquet(parquet_path, engine='pyarrow')
+        except (ValueError, OSError):
+            pass  # Corrupt cache - fall through to a fresh CSV read
+
+    # Map raw headers to normalized names so the dtype/date hints apply
+    # regardless of the casing the source file uses. Reading just the
+    # header row also lets us reject files with the wrong schema before
+    # paying for the full parse.
+    header = pd.read_csv(csv_path, nrows=0).columns
+    normalized = {col: col.lower().strip() for col in header}
+
+    missing = REQUIRED_CSV_COLUMNS - set(normalized.values())
+    if missing:
+        raise ValueError(
+            f"{csv_path.name} is missing required column(s): {', '.join(sorted(missing))}"
+        )
+    dtypes = {col: CSV_DTYPES[norm] for col, norm in normalized.items() if norm in CSV_DTYPES}
+    date_cols = [col for col, norm in normalized.items() if norm in PARSE_DATES]
+
+    df = pd.read_csv(csv_path, dtype=dtypes, parse_dates=date_cols, cache_dates=True)
+    # Single pure-Python pass instead of two Index .str accessor passes
+    df.columns = [c.strip().lower() for c in df.columns]
+
+    if have_pyarrow:
+        try:
+            df.to_parquet(parquet_path, engine='pyarrow', compression='zstd')
+            meta_path.write_text(json.dumps({'mtime': stat.st_mtime, 'size': stat.st_size}))
+        except (OSError, ValueError):
+            pass  # Cache write is best-effort; the parsed frame is still valid
+
+    return df
+
+
+@functools.lru_cache(maxsize=64)
+def _encoded_pdf_payload(path, mtime_ns):
+    """Base64-encode a PDF once per (path, mtime) for attachment reuse.
+
+    Encoding a multi-MB report is measurable per message; when the same
+    PDF goes out more than once (retries, shared reports) the encoded
+    bytes are served from cache. mtime keys the cache like the CSV loader.
+    """
+    import base64
+    return base64.encodebytes(Path(path).read_bytes()).decode('ascii')
+
+
+@functools.lru_cache(maxsize=4)
+def _read_csv_cached(path, mtime_ns, size):
+    """Parse a data file once per (path, mtime, size) and memoize the result.
+
+    ``mtime_ns`` and ``size`` are part of the cache key so the cache
+    invalidates itself whenever the file changes on disk (size catches
+    rewrites within mtime resolution); a plain "Reload Data" with an
+    unchanged file returns the already-parsed frame instantly. Callers must
+    ``.copy()`` the returned frame before mutating it.
+    """
+    return _load_master_with_cache(path)
+
+
+# One C-level pass per name instead of a Python loop per character
+# (\w also matches '_', which maps to itself anyway)
+_UNSAFE_FILENAME_RE = re.compile(r'[^\w\- ]')
+
+# Single-pass remap of filesystem-hostile characters for display names
+_DISPLAY_NAME_TRANS = str.maketrans({'/': '-', '\\': '-', ':': '-',
+                                     '*': '', '?': '', '"': "'",
+                                     '<': '(', '>': ')', '|': '-'})
+
+
+def _safe_filename(name):
+    """Sanitize a name for use inside a filesystem path"""
+    if pd.isna(name) or name == "":
+        return "Unknown"
+    return _UNSAFE_FILENAME_RE.sub('_', str(name)).replace(" ", "_")
+
+
+def _safe_display_name(name):
+    """Sanitize a name for display inside a PDF filename"""
+    if pd.isna(name) or name == "":
+        return "Unknown"
+    return str(name).strip().translate(_DISPLAY_NAME_TRANS)
+
+
+def _pdf_name_for(row, template):
+    """Compute the output PDF filename the renderer will use for a row"""
+    date_str = datetime.now().strftime("%Y%m%d")
+    report_name = Path(template).stem
+    display_company = _safe_display_name(row.get('company_name', 'Unknown'))
+    display_person = _safe_display_name(row.get('name', 'Unknown'))
+    return f"{date_str} {report_name} ({display_company} - {display_person}).pdf"
+
+
+def _render_one(row, template, debug_mode, diagnostic_mode, force=False):
+    """Render one respondent report via Quarto.
+
+    Runs in a worker process, so it stays self-contained: it takes a plain
+    dict for the row and returns a plain result dict for the GUI thread to
+    log. Each worker renders its own per-process copy of the template to a
+    per-process temp file: knitr drops intermediates (figures, .tex) in a
+    directory named after the input file, so two processes rendering the
+    same .qmd would cross-contaminate each other's figures. The copy lives
+    next to the original so relative data paths still resolve, and is
+    reused for the life of the worker.
+    """
+    import shutil
+
+    company = row.get('company_name', 'Unknown')
+    person = row.get('name', 'Unknown')
+    safe_company = _safe_filename(company)
+    safe_person = _safe_filename(person)
+
+    output_filename = _pdf_name_for(row, template)
+    output_file = REPORTS_DIR / output_filename
+
+    result = {
+        'status': 'error',
+        'company': company,
+        'person': person,
+        'output_filename': output_filename,
+        'output_file': str(output_file),
+        'detail': '',
+        'stderr': '',
+        'stdout': '',
+    }
+
+    if output_file.exists() and not force:
+        result['status'] = 'exists'
+        return result
+
+    pid = os.getpid()
+    source_template = ROOT_DIR / template
+    selected_template = ROOT_DIR / f"temp_worker_{pid}_{source_template.name}"
+    try:
+        # copy2 preserves mtime, so an edited source re-copies on next use
+        if (not selected_template.exists()
+                or selected_template.stat().st_mtime_ns < source_template.stat().st_mtime_ns):
+            shutil.copy2(source_template, selected_template)
+    except OSError as e:
+        result['detail'] = f'Could not stage template copy: {e}'
+        return result
+
+    temp_output = f"temp_{pid}_{safe_company}_{safe_person}.pdf"
+    cmd = [
+        'quarto', 'render', str(selected_template),
+        '-P', f'company={company}',
+        '-P', f'person={person}',
+        '-P', f'debug_mode={debug_mode}',
+        '-P', f'diagnostic_mode={diagnostic_mode}',
+        '--to', 'pdf',
+        *QUARTO_PDF_ENGINE_ARGS,
+        '--output', temp_output
+        # Removed --quiet to capture error details
+    ]
+
+    try:
+        proc = subprocess.run(cmd, cwd=ROOT_DIR, capture_output=True, text=True, timeout=300)
+    except FileNotFoundError:
+        result['detail'] = 'Quarto not found - please install from https://quarto.org'
+        return result
+    except subprocess.TimeoutExpired:
+        result['detail'] = 'Generation timeout (>5 minutes)'
+        return result
+    except Exception as e:
+        result['detail'] = str(e)
+        return result
+
+    result['stderr'] = proc.stderr or ''
+    result['stdout'] = proc.stdout or ''
+
+    if proc.returncode == 0:
+        temp_path = ROOT_DIR / temp_output
+        if temp_path.exists():
+            shutil.move(str(temp_path), str(output_file))
+            result['status'] = 'success'
+        else:
+            result['detail'] = 'Output file not found'
+    else:
+        result['detail'] = f'Exit code {proc.returncode}'
+
+    return result
 
 
 class ResilienceScanGUI:
@@ -53,8 +320,39 @@ class ResilienceScanGUI:
         self.df = None
         self.generation_queue = queue.Queue()
         self.email_queue = queue.Queue()
+        self._log_queue = queue.Queue()
+        self._pending_log_lines = {'system': [], 'gen': [], 'email': []}
+        self._ts_second = 0
+        self._ts_full = ''
+        self._ts_short = ''
+        self._render_pool = None
+        self._pdf_count_cache = (None, 0)
+        self._email_reports = []
+        self._email_rows_inserted = 0
+        self._email_scan_cache = None
+        self._email_scan_mtime = None
+        self._email_scan_df = None
+        self._filter_after_id = None
+        self._mask_cache = None
+        self._mask_cache_df = None
+        self._display_df = None
+        self._display_cache_key = None
+        self._data_preview_rows = []
+        self._data_rows_inserted = 0
+        self._data_insert_busy = False
+        self._data_topup_wanted = False
+        self._lookup_cache = None
+        self._lookup_cache_df = None
+        self._smtp_local = threading.local()
+        self._quality_cache = None
+        self._quality_cache_df = None
+        self._search_blob = None
+        self._search_blob_df = None
+        self._stats_text_cache = None
+        self._stats_text_df = None
         self.is_generating = False
         self.is_sending_emails = False
+        self._stop_evt = threading.Event()
 
         # Email tracking system
         self.email_tracker = EmailTracker()
@@ -68,10 +366,27 @@ class ResilienceScanGUI:
             'errors': 0
         }
 
+        # Seed from the last session so the header paints with known
+        # values immediately; the regular refresh paths (mtime-cached
+        # report count, tracker stats) overwrite anything stale.
+        try:
+            if STATS_CACHE_FILE.exists():
+                cached_stats = json.loads(STATS_CACHE_FILE.read_text())
+                self.stats.update({k: cached_stats[k] for k in self.stats if k in cached_stats})
+        except (ValueError, OSError):
+            pass
+        atexit.register(self._save_stats_cache)
+
         # Setup GUI
         self.setup_ui()
         self.load_initial_data()
 
+        # Start the batched log drain (every 20 ms); the file mirror runs on
+        # its own daemon thread so disk latency never blocks the Tk thread
+        self._log_file_queue = queue.Queue()
+        threading.Thread(target=self._log_file_writer, daemon=True).start()
+        self.root.after(20, self._drain_log_queue)
+
     def setup_ui(self):
         """Create the main UI layout"""
 
@@ -83,6 +398,7 @@ class ResilienceScanGUI:
         menubar.add_cascade(label="File", menu=file_menu)
         file_menu.add_command(label="Load Data File...", command=self.load_data_file)
         file_menu.add_command(label="Reload Data", command=self.load_initial_data)
+        file_menu.add_command(label="Force Reload", command=self.force_reload_data)
         file_menu.add_separator()
         file_menu.add_command(label="Exit", command=self.root.quit)
 
@@ -107,16 +423,52 @@ class ResilienceScanGUI:
         self.notebook = ttk.Notebook(main_container)
         self.notebook.grid(row=1, column=0, sticky=(tk.W, tk.E, tk.N, tk.S), pady=10)
 
-        # Create tabs
+        # Create tabs. Only the Dashboard is built eagerly; the other tabs
+        # are added as empty placeholders and built the first time the user
+        # selects them, which keeps cold-start widget creation to one tab.
         self.create_dashboard_tab()
-        self.create_data_tab()
-        self.create_generation_tab()
-        self.create_email_tab()
-        self.create_logs_tab()
+
+        self._tab_builders = {}
+        for text, builder, refresher in [
+            ("📁 Data", self.create_data_tab, self.update_data_preview),
+            (" Generation", self.create_generation_tab, None),
+            ("📧 Email", self.create_email_tab, self.update_email_status_display),
+            ("📋 Logs", self.create_logs_tab, None),
+        ]:
+            placeholder = ttk.Frame(self.notebook)
+            self.notebook.add(placeholder, text=text)
+            self._tab_builders[str(placeholder)] = (placeholder, builder, refresher)
+
+        self.notebook.bind('<<NotebookTabChanged>>', self._on_tab_changed)
 
         # Status bar
         self.create_status_bar(main_container)
 
+    def _on_tab_changed(self, event=None):
+        """Build a lazily-added tab the first time it is selected"""
+        entry = self._tab_builders.pop(self.notebook.select(), None)
+        if entry is None:
+            return
+
+        frame, builder, refresher = entry
+        builder(frame)
+        if refresher is not None:
+            refresher()
+
+    def _ensure_tab_built(self, builder):
+        """Force-build a lazily-added tab.
+
+        Used by Quick Actions that need a tab's widgets before the user has
+        ever selected it.
+        """
+        for key, (frame, tab_builder, refresher) in list(self._tab_builders.items()):
+            if tab_builder == builder:
+                del self._tab_builders[key]
+                tab_builder(frame)
+                if refresher is not None:
+                    refresher()
+                break
+
     def create_header(self, parent):
         """Create application header"""
         header_frame = ttk.Frame(parent)
@@ -240,10 +592,8 @@ class ResilienceScanGUI:
         dashboard.columnconfigure(0, weight=1)
         dashboard.rowconfigure(1, weight=1)
 
-    def create_data_tab(self):
-        """Create data viewing and processing tab with analysis features"""
-        data_tab = ttk.Frame(self.notebook)
-        self.notebook.add(data_tab, text="📁 Data")
+    def create_data_tab(self, data_tab):
+        """Build the data viewing and processing tab into its placeholder"""
 
         # Top controls
         controls_frame = ttk.Frame(data_tab)
@@ -302,7 +652,7 @@ class ResilienceScanGUI:
         # Search box
         ttk.Label(filter_frame, text="Search:").grid(row=0, column=0, sticky=tk.W, padx=5)
         self.data_search_var = tk.StringVar()
-        self.data_search_var.trace('w', lambda *args: self.filter_data())
+        self.data_search_var.trace('w', lambda *args: self._schedule_filter())
         search_entry = ttk.Entry(filter_frame, textvariable=self.data_search_var, width=40)
         search_entry.grid(row=0, column=1, sticky=(tk.W, tk.E), padx=5)
 
@@ -393,7 +743,7 @@ class ResilienceScanGUI:
         # Treeview for data
         self.data_tree = ttk.Treeview(
             preview_frame,
-            yscrollcommand=tree_scroll_y.set,
+            yscrollcommand=self._on_data_tree_scroll,
             xscrollcommand=tree_scroll_x.set,
             height=15
         )
@@ -401,6 +751,9 @@ class ResilienceScanGUI:
         tree_scroll_y.config(command=self.data_tree.yview)
         tree_scroll_x.config(command=self.data_tree.xview)
 
+        # Kept so bulk refreshes can detach/reattach the scrollbar
+        self._data_tree_yscroll = tree_scroll_y.set
+
         # Bind double-click to show row details
         self.data_tree.bind('<Double-Button-1>', self.show_row_details)
 
@@ -433,10 +786,8 @@ class ResilienceScanGUI:
         self.filtered_df = None
         self.visible_columns = ['company_name', 'name', 'email_address', 'submitdate']
 
-    def create_generation_tab(self):
-        """Create PDF generation tab"""
-        gen_tab = ttk.Frame(self.notebook)
-        self.notebook.add(gen_tab, text=" Generation")
+    def create_generation_tab(self, gen_tab):
+        """Build the PDF generation tab into its placeholder"""
 
         # Controls
         controls_frame = ttk.LabelFrame(gen_tab, text="Generation Controls", padding=10)
@@ -485,6 +836,7 @@ class ResilienceScanGUI:
 
         self.debug_mode_var = tk.BooleanVar(value=False)
         self.demo_mode_var = tk.BooleanVar(value=False)
+        self.force_regenerate_var = tk.BooleanVar(value=False)
 
         ttk.Checkbutton(
             modes_frame,
@@ -496,6 +848,12 @@ class ResilienceScanGUI:
             modes_frame,
             text="Demo Mode (use synthetic test data)",
             variable=self.demo_mode_var
+        ).pack(side=tk.LEFT, padx=(0, 20))
+
+        ttk.Checkbutton(
+            modes_frame,
+            text="Force Regenerate (redo existing PDFs)",
+            variable=self.force_regenerate_var
         ).pack(side=tk.LEFT)
 
         controls_frame.columnconfigure(1, weight=1)
@@ -572,10 +930,8 @@ class ResilienceScanGUI:
         gen_tab.columnconfigure(0, weight=1)
         gen_tab.rowconfigure(2, weight=1)
 
-    def create_email_tab(self):
-        """Create email distribution tab"""
-        email_tab = ttk.Frame(self.notebook)
-        self.notebook.add(email_tab, text="📧 Email")
+    def create_email_tab(self, email_tab):
+        """Build the email distribution tab into its placeholder"""
 
         # Create notebook for email tab sections
         email_notebook = ttk.Notebook(email_tab)
@@ -783,10 +1139,13 @@ class ResilienceScanGUI:
             columns=('Company', 'Person', 'Email', 'Status', 'Date', 'Mode'),
             show='headings',
             height=8,
-            yscrollcommand=tree_scroll.set
+            yscrollcommand=self._on_email_tree_scroll
         )
         tree_scroll.config(command=self.email_status_tree.yview)
 
+        # Kept so bulk refreshes can detach/reattach the scrollbar
+        self._email_tree_yscroll = tree_scroll.set
+
         self.email_status_tree.heading('Company', text='Company')
         self.email_status_tree.heading('Person', text='Person')
         self.email_status_tree.heading('Email', text='Email')
@@ -803,6 +1162,11 @@ class ResilienceScanGUI:
 
         self.email_status_tree.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
 
+        # Status colors are fixed; configure the tags once at build time
+        # instead of on every refresh
+        self.email_status_tree.tag_configure('sent', foreground='green')
+        self.email_status_tree.tag_configure('pending', foreground='orange')
+
         # Manual update buttons
         update_btn_frame = ttk.Frame(status_frame)
         update_btn_frame.grid(row=3, column=0, sticky=tk.W, pady=5)
@@ -908,10 +1272,8 @@ class ResilienceScanGUI:
         # Load initial email status display
         self.root.after(100, self.update_email_status_display)
 
-    def create_logs_tab(self):
-        """Create system logs tab"""
-        logs_tab = ttk.Frame(self.notebook)
-        self.notebook.add(logs_tab, text="📋 Logs")
+    def create_logs_tab(self, logs_tab):
+        """Build the system logs tab into its placeholder"""
 
         # Controls
         controls_frame = ttk.Frame(logs_tab)
@@ -975,52 +1337,111 @@ class ResilienceScanGUI:
 
         status_frame.columnconfigure(1, weight=1)
 
-        # Update time every second
+        # Show the time immediately; subsequent refreshes piggyback on the
+        # log-drain heartbeat instead of a second after() loop.
         self.update_time()
 
     # ==================== Data Methods ====================
 
     def load_initial_data(self):
-        """Load data on startup"""
+        """Load data on startup (reading happens off the Tk thread)"""
+        if not DATA_FILE.exists():
+            self.log("[INFO] No data loaded - cleaned_master.csv not found")
+            self.log("[INFO] First time setup: Use 'Data' tab to import and clean your data")
+            self.status_label.config(text="No data loaded - use Data tab to import and clean data")
+            # Initialize with empty stats
+            self.stats['total_respondents'] = 0
+            self.stats['total_companies'] = 0
+            self.stats['emails_sent'] = 0
+            self.update_stats_display()
+            return
+
         self.log("Loading data from: " + str(DATA_FILE))
-        try:
-            if DATA_FILE.exists():
-                self.df = pd.read_csv(DATA_FILE)
-                self.df.columns = self.df.columns.str.lower().str.strip()
+        self.status_label.config(text="Loading data...")
+        threading.Thread(target=self._load_data_worker, daemon=True).start()
 
-                # Update statistics
-                self.stats['total_respondents'] = len(self.df)
-                self.stats['total_companies'] = self.df['company_name'].nunique()
+    def _load_data_worker(self):
+        """Read the CSV and refresh the tracker import off the Tk thread.
 
-                # Import data into email tracker
+        The parse and the SQLite import are the slow parts of startup;
+        running them here keeps the window responsive and the finished
+        frame is handed back to the main thread via root.after. The
+        tracker is safe to touch here (thread-local connections).
+        """
+        try:
+            stat = DATA_FILE.stat()
+            df = _read_csv_cached(str(DATA_FILE), stat.st_mtime_ns, stat.st_size).copy()
+
+            # Import data into email tracker, skipped entirely when the
+            # CSV is unchanged since the last import (the sidecar stores
+            # the mtime/size key of the last imported file). The sidecar
+            # only counts if the DB actually holds records — otherwise a
+            # deleted/recreated email_tracking.db would never be refilled.
+            tracker_cache = ROOT_DIR / ".email_tracker_cache.json"
+            cache_key = {'mtime_ns': stat.st_mtime_ns, 'size': stat.st_size}
+            cached_key = None
+            if tracker_cache.exists():
+                try:
+                    cached_key = json.loads(tracker_cache.read_text())
+                except (ValueError, OSError):
+                    cached_key = None
+
+            if cached_key == cache_key and self.email_tracker.get_statistics()['total'] > 0:
+                self.log("[OK] Email tracker: up to date (CSV unchanged)")
+            else:
                 self.log("Importing email tracking data...")
                 imported, skipped = self.email_tracker.import_from_csv(str(DATA_FILE))
                 self.log(f"[OK] Email tracker: {imported} imported, {skipped} skipped")
+                try:
+                    tracker_cache.write_text(json.dumps(cache_key))
+                except OSError:
+                    pass
 
-                # Update email statistics
-                email_stats = self.email_tracker.get_statistics()
-                self.stats['emails_sent'] = email_stats.get('sent', 0)
-
-                self.update_stats_display()
-                self.update_data_preview()
-                self.update_stats_text()
-                self.update_email_status_display()
-                self.analyze_data_quality()
-
-                self.log(f"[OK] Data loaded: {len(self.df)} respondents, {self.stats['total_companies']} companies")
-                self.status_label.config(text=f"Data loaded: {len(self.df)} records")
-            else:
-                self.log("[INFO] No data loaded - cleaned_master.csv not found")
-                self.log("[INFO] First time setup: Use 'Data' tab to import and clean your data")
-                self.status_label.config(text="No data loaded - use Data tab to import and clean data")
-                # Initialize with empty stats
-                self.stats['total_respondents'] = 0
-                self.stats['total_companies'] = 0
-                self.stats['emails_sent'] = 0
-                self.update_stats_display()
+            email_stats = self.email_tracker.get_statistics()
         except Exception as e:
             self.log(f"[ERROR] Error loading data: {e}")
-            messagebox.showerror("Error", f"Failed to load data:\n{e}")
+
+            def report_error(error=e):
+                self.status_label.config(text="Ready")
+                messagebox.showerror("Error", f"Failed to load data:\n{error}")
+            self.root.after(0, report_error)
+            return
+
+        self.root.after(0, self._on_data_loaded, df, email_stats)
+
+    def _on_data_loaded(self, df, email_stats):
+        """Main-thread completion handler: bind the frame, refresh the UI"""
+        self.df = df
+
+        # Update statistics
+        self.stats['total_respondents'] = len(self.df)
+        self.stats['total_companies'] = self.df['company_name'].nunique()
+        self.stats['emails_sent'] = email_stats.get('sent', 0)
+
+        self.update_stats_display()
+        self.update_data_preview()
+        self.update_stats_text()
+        self.update_email_status_display()
+        self.analyze_data_quality()
+
+        self.log(f"[OK] Data loaded: {len(self.df)} respondents, {self.stats['total_companies']} companies")
+        self.status_label.config(text=f"Data loaded: {len(self.df)} records")
+
+    def force_reload_data(self):
+        """Reload data from disk, bypassing the in-memory parse cache"""
+        _read_csv_cached.cache_clear()
+        self.load_initial_data()
+
+    def _reload_data_file(self):
+        """Rebind self.df from DATA_FILE through the shared cached loader.
+
+        Used by the synchronous reload paths (post-convert/clean, email
+        status fallback, post-send refresh) so they get the same explicit
+        dtypes, date parsing and Parquet sidecar as the main load; a file
+        that just changed gets a fresh parse via the mtime/size key.
+        """
+        stat = DATA_FILE.stat()
+        self.df = _read_csv_cached(str(DATA_FILE), stat.st_mtime_ns, stat.st_size).copy()
 
     def load_data_file(self):
         """Browse and load a different data file"""
@@ -1032,10 +1453,12 @@ class ResilienceScanGUI:
 
         if filename:
             try:
-                self.df = pd.read_csv(filename)
-                self.df.columns = self.df.columns.str.lower().str.strip()
+                file_path = Path(filename)
+                stat = file_path.stat()
+                self.df = _read_csv_cached(str(file_path), stat.st_mtime_ns, stat.st_size).copy()
 
-                self.data_file_label.config(text=filename)
+                if hasattr(self, 'data_file_label'):
+                    self.data_file_label.config(text=filename)
                 self.stats['total_respondents'] = len(self.df)
                 self.stats['total_companies'] = self.df['company_name'].nunique()
 
@@ -1068,8 +1491,7 @@ class ResilienceScanGUI:
 
                 # Automatically load the converted data
                 try:
-                    self.df = pd.read_csv(DATA_FILE)
-                    self.df.columns = self.df.columns.str.lower().str.strip()
+                    self._reload_data_file()
                     self.update_stats_display()
                     self.update_data_preview()
                     self.update_stats_text()
@@ -1122,8 +1544,7 @@ class ResilienceScanGUI:
 
                 # Automatically reload the cleaned data
                 try:
-                    self.df = pd.read_csv(DATA_FILE)
-                    self.df.columns = self.df.columns.str.lower().str.strip()
+                    self._reload_data_file()
                     self.update_stats_display()
                     self.update_data_preview()
                     self.update_stats_text()
@@ -1158,6 +1579,21 @@ class ResilienceScanGUI:
             messagebox.showerror("Error", f"Failed to run data cleaning:\n{e}")
             self.status_label.config(text="Error")
 
+    @staticmethod
+    def _insert_file_chunked(text_widget, fh):
+        """Stream a report file into a Text widget in 64 KB chunks.
+
+        One giant insert makes Tk lay out the whole document before the
+        window paints; chunking with update_idletasks between inserts keeps
+        large reports from stalling the event loop.
+        """
+        while True:
+            buf = fh.read(65536)
+            if not buf:
+                break
+            text_widget.insert(tk.END, buf)
+            text_widget.update_idletasks()
+
     def view_cleaning_report(self):
         """Display the detailed cleaning report in a new window"""
         from pathlib import Path
@@ -1194,8 +1630,7 @@ class ResilienceScanGUI:
         # Load and display report
         try:
             with open(report_path, 'r', encoding='utf-8') as f:
-                report_content = f.read()
-            text_widget.insert('1.0', report_content)
+                self._insert_file_chunked(text_widget, f)
             text_widget.config(state=tk.DISABLED)
 
             # Button frame
@@ -1245,9 +1680,16 @@ class ResilienceScanGUI:
             with open(log_path, 'r', encoding='utf-8') as f:
                 log_data = json.load(f)
 
-            # Format JSON with pretty printing
-            formatted_log = json.dumps(log_data, indent=2)
-            text_widget.insert('1.0', formatted_log)
+            # Pretty-print one top-level section at a time instead of
+            # building the whole indented document as a single string and
+            # inserting it in one layout-blocking call
+            if isinstance(log_data, dict):
+                for key, value in log_data.items():
+                    section = json.dumps({key: value}, indent=2)
+                    text_widget.insert(tk.END, section + '\n')
+                    text_widget.update_idletasks()
+            else:
+                text_widget.insert('1.0', json.dumps(log_data, indent=2))
             text_widget.config(state=tk.DISABLED)
 
             # Button frame
@@ -1363,8 +1805,7 @@ class ResilienceScanGUI:
         # Load and display report
         try:
             with open(report_path, 'r', encoding='utf-8') as f:
-                report_content = f.read()
-            text_widget.insert('1.0', report_content)
+                self._insert_file_chunked(text_widget, f)
             text_widget.config(state=tk.DISABLED)
 
             # Button frame
@@ -1386,8 +1827,26 @@ class ResilienceScanGUI:
         if self.df is None:
             return
 
-        # Apply current filter
-        self.filter_data()
+        # The Data tab is built lazily; nothing to refresh until then
+        if not hasattr(self, 'data_tree'):
+            return
+
+        # Filtering and cell-string building are pure pandas, so run them
+        # off the Tk thread and marshal only the treeview population back.
+        # The Tk-side filter inputs are snapshotted here, on the main
+        # thread, before the worker starts.
+        state = self._filter_state()
+
+        def worker():
+            self._apply_filters(state)
+            preview = self._build_preview_rows()
+            self.root.after(0, self._finish_data_preview, preview)
+
+        threading.Thread(target=worker, daemon=True).start()
+
+    def _finish_data_preview(self, preview):
+        """Apply a background-built preview on the Tk thread"""
+        self._populate_data_tree(preview)
 
         # Run data quality analysis
         self.analyze_data_quality()
@@ -1399,6 +1858,30 @@ class ResilienceScanGUI:
 
         self.stats_text.delete('1.0', tk.END)
 
+        # The dataset section only changes on reload, so the rendered text
+        # is cached against the frame identity; the reports line below is
+        # appended fresh (its count moves independently of the data).
+        if self._stats_text_df is self.df:
+            stats_info = self._stats_text_cache
+        else:
+            stats_info = self._build_stats_text()
+            self._stats_text_cache = stats_info
+            self._stats_text_df = self.df
+
+        # Count existing reports
+        if REPORTS_DIR.exists():
+            stats_info += f"\n\nREPORTS GENERATED:\n  Total PDF files:         {self._count_reports():>6}\n"
+
+        self.stats_text.insert('1.0', stats_info)
+
+    def _build_stats_text(self):
+        """Render the dataset section of the statistics overview"""
+        # One hash-group pass serves everything below: a single histogram
+        # over the counts yields all four engagement buckets and the top-10
+        # list is just its head (value_counts sorts descending already).
+        counts = self.df['company_name'].value_counts()
+        buckets, _ = np.histogram(counts.to_numpy(), bins=[1, 2, 6, 11, np.inf])
+
         stats_info = f"""
 ═══════════════════════════════════════════════════════════════
 RESILIENCESCAN DATA OVERVIEW
@@ -1406,76 +1889,175 @@ RESILIENCESCAN DATA OVERVIEW
 
 DATASET STATISTICS:
   Total Respondents:       {len(self.df):>6}
-  Unique Companies:        {self.df['company_name'].nunique():>6}
+  Unique Companies:        {len(counts):>6}
 
 ENGAGEMENT METRICS:
-  Companies with 1 resp:   {sum(self.df.groupby('company_name').size() == 1):>6}
-  Companies with 2-5:      {sum((self.df.groupby('company_name').size() >= 2) & (self.df.groupby('company_name').size() <= 5)):>6}
-  Companies with 6-10:     {sum((self.df.groupby('company_name').size() >= 6) & (self.df.groupby('company_name').size() <= 10)):>6}
-  Companies with 10+:      {sum(self.df.groupby('company_name').size() > 10):>6}
+  Companies with 1 resp:   {buckets[0]:>6}
+  Companies with 2-5:      {buckets[1]:>6}
+  Companies with 6-10:     {buckets[2]:>6}
+  Companies with 10+:      {buckets[3]:>6}
 
 TOP 10 MOST ENGAGED COMPANIES:
 """
 
-        top_companies = self.df['company_name'].value_counts().head(10)
+        top_companies = counts.head(10)
         for idx, (company, count) in enumerate(top_companies.items(), 1):
             stats_info += f"  {idx:2}. {company:<40} {count:>3} respondents\n"
 
-        # Count existing reports
-        if REPORTS_DIR.exists():
-            reports = list(REPORTS_DIR.glob("*.pdf"))
-            stats_info += f"\n\nREPORTS GENERATED:\n  Total PDF files:         {len(reports):>6}\n"
-
-        self.stats_text.insert('1.0', stats_info)
+        return stats_info
 
     # ==================== Data Analysis Methods ====================
 
+    def _schedule_filter(self):
+        """Debounce search keystrokes: only the last change in a 200 ms
+        window triggers the pandas filter pass and tree rebuild"""
+        if self._filter_after_id is not None:
+            self.root.after_cancel(self._filter_after_id)
+        self._filter_after_id = self.root.after(200, self._run_scheduled_filter)
+
+    def _run_scheduled_filter(self):
+        self._filter_after_id = None
+        self.filter_data()
+
     def filter_data(self):
         """Filter data based on search and filter options"""
         if self.df is None:
             return
 
-        df_filtered = self.df.copy()
+        self._apply_filters(self._filter_state())
 
-        # Apply search filter
-        search_term = self.data_search_var.get().lower()
-        if search_term:
-            mask = df_filtered.astype(str).apply(
-                lambda row: row.str.lower().str.contains(search_term, na=False).any(),
-                axis=1
+        # Update treeview
+        self.refresh_data_tree()
+
+    def _filter_masks(self):
+        """Missing-email and duplicate masks for the loaded frame.
+
+        Computed once per loaded DataFrame and reused by every filter pass
+        and preview rebuild; keeping a reference to the frame the masks were
+        built from means any reload (which rebinds self.df) naturally
+        invalidates the cache. Pure pandas work - safe off the Tk thread.
+        """
+        if self._mask_cache_df is not self.df:
+            if 'email_address' in self.df.columns:
+                emails = self.df['email_address']
+                missing = emails.isna() | ~emails.astype(str).str.contains('@', na=False)
+            else:
+                missing = pd.Series(True, index=self.df.index)
+
+            dup = self.df.duplicated(
+                subset=['company_name', 'name', 'email_address'], keep=False
             )
+
+            self._mask_cache = (missing, dup)
+            self._mask_cache_df = self.df
+        return self._mask_cache
+
+    def _display_frame(self):
+        """Column-pruned view of the loaded frame for the preview path.
+
+        Rebuilt only when the frame is reloaded or the visible columns
+        change, so cell rendering touches the handful of displayed
+        columns instead of the full CSV width. Identity of self.df doubles
+        as the invalidation key, same as _filter_masks.
+        """
+        cols = [col for col in self.visible_columns if col in self.df.columns]
+        key = (self.df, tuple(cols))
+        if self._display_cache_key is None or \
+                self._display_cache_key[0] is not key[0] or \
+                self._display_cache_key[1] != key[1]:
+            self._display_df = self.df[cols]
+            self._display_cache_key = key
+        return self._display_df
+
+    def _search_haystack(self):
+        """Lowercased per-row search text over the full loaded frame.
+
+        Built once per loaded frame (NUL-joined so matches can't span
+        column boundaries) so each keystroke's search is one C-level
+        substring scan instead of a row-wise regex apply. All columns are
+        included - hidden ones too - so search semantics match the
+        baseline's whole-row matching; the one-time build cost is paid on
+        the worker thread, not per keystroke.
+        """
+        if self._search_blob_df is not self.df:
+            sub = self.df.astype(str).where(self.df.notna(), '')
+            self._search_blob = sub.agg('\x00'.join, axis=1).str.lower()
+            self._search_blob_df = self.df
+        return self._search_blob
+
+    def _filter_state(self):
+        """Snapshot the Tk-side filter inputs (main thread only).
+
+        The .get() calls go through the Tcl interpreter, so they must not
+        run on a worker thread; callers take the snapshot before handing
+        off to _apply_filters.
+        """
+        show_all = self.show_all_var.get()
+        return (self.data_search_var.get().lower(),
+                self.show_no_email_var.get() and not show_all,
+                self.show_duplicates_var.get() and not show_all)
+
+    def _apply_filters(self, state):
+        """Compute self.filtered_df from a _filter_state snapshot.
+
+        Pure pandas work - safe to run off the Tk thread.
+        """
+        search_term, only_no_email, only_duplicates = state
+        df_filtered = self.df
+        missing_mask, dup_mask = self._filter_masks()
+
+        # Apply search filter against the cached whole-row haystack
+        if search_term:
+            mask = self._search_haystack().str.contains(search_term, regex=False, na=False)
             df_filtered = df_filtered[mask]
 
-        # Apply checkbox filters
-        if self.show_no_email_var.get() and not self.show_all_var.get():
+        # Apply checkbox filters (precomputed masks, aligned by index)
+        if only_no_email:
             # Show only missing emails
-            df_filtered = df_filtered[
-                df_filtered['email_address'].isna() |
-                ~df_filtered['email_address'].str.contains('@', na=False)
-            ]
-        elif self.show_duplicates_var.get() and not self.show_all_var.get():
+            df_filtered = df_filtered[missing_mask.loc[df_filtered.index]]
+        elif only_duplicates:
             # Show only duplicates
-            df_filtered = df_filtered[
-                df_filtered.duplicated(subset=['company_name', 'name', 'email_address'], keep=False)
-            ]
+            df_filtered = df_filtered[dup_mask.loc[df_filtered.index]]
 
         self.filtered_df = df_filtered
 
-        # Update treeview
-        self.refresh_data_tree()
+    def _build_preview_rows(self):
+        """Vectorize the preview's cell strings and highlight masks.
+
+        Pure pandas work - safe to run off the Tk thread. Missing cells
+        render as blanks rather than literal 'nan'/'NaT'.
+        """
+        display = self._display_frame()
+        display_columns = list(display.columns)
+
+        sub = display.loc[self.filtered_df.index]
+        values_rows = sub.astype(str).where(sub.notna(), '').to_numpy().tolist()
+
+        # Highlights reuse the cached full-frame masks, narrowed to the
+        # filtered rows, instead of recomputing per rebuild
+        missing_mask, dup_mask = self._filter_masks()
+        no_email_mask = missing_mask.loc[self.filtered_df.index].tolist()
+        dup_mask = dup_mask.loc[self.filtered_df.index].tolist()
+
+        return display_columns, values_rows, no_email_mask, dup_mask
 
     def refresh_data_tree(self):
         """Refresh treeview with filtered data"""
         if self.filtered_df is None:
             return
 
-        # Clear existing
-        for item in self.data_tree.get_children():
-            self.data_tree.delete(item)
+        self._populate_data_tree(self._build_preview_rows())
 
-        # Setup columns
-        display_columns = [col for col in self.visible_columns if col in self.filtered_df.columns]
+    def _populate_data_tree(self, preview):
+        """Insert prebuilt preview rows into the treeview (Tk thread only)"""
+        display_columns, values_rows, no_email_mask, dup_mask = preview
+
+        # Clear existing (one Tcl call instead of one delete per row)
+        children = self.data_tree.get_children()
+        if children:
+            self.data_tree.delete(*children)
 
+        # Setup columns
         self.data_tree['columns'] = display_columns
         self.data_tree['show'] = 'headings'
 
@@ -1484,32 +2066,93 @@ TOP 10 MOST ENGAGED COMPANIES:
                                   command=lambda c=col: self.sort_by_column(c))
             self.data_tree.column(col, width=150)
 
-        # Add data (show ALL rows, not just 100)
-        for idx, row in self.filtered_df.iterrows():
-            values = [str(row.get(col, '')) for col in display_columns]
-
-            # Tag duplicates and missing emails for highlighting
-            tags = []
-            if pd.isna(row.get('email_address')) or '@' not in str(row.get('email_address', '')):
-                tags.append('no_email')
-            if self.filtered_df.duplicated(subset=['company_name', 'name', 'email_address'], keep=False).iloc[
-                self.filtered_df.index.get_loc(idx)]:
-                tags.append('duplicate')
-
-            self.data_tree.insert('', tk.END, values=values, tags=tuple(tags))
+        # Window the rows like the email list: only the first page goes in
+        # now and scrolling near the bottom tops the view up, so insert cost
+        # is O(page) regardless of how many rows matched the filter. The
+        # scrollbar is detached during the bulk insert so Tk doesn't
+        # recompute scroll geometry per row.
+        self._data_preview_rows = list(zip(values_rows, no_email_mask, dup_mask))
+        self._data_rows_inserted = 0
+        self._data_insert_busy = False
+        self._data_topup_wanted = False
+
+        self.data_tree.configure(yscrollcommand='')
+        try:
+            self._append_data_rows()
+        finally:
+            self.data_tree.configure(yscrollcommand=self._on_data_tree_scroll)
+            self.data_tree.yview_moveto(0)
 
         # Configure tag colors
         self.data_tree.tag_configure('no_email', background='#ffebee')  # Light red
         self.data_tree.tag_configure('duplicate', background='#fff3e0')  # Light orange
 
         # Update info
-        total_rows = len(self.filtered_df)
+        total_rows = len(self._data_preview_rows)
         all_rows = len(self.df) if self.df is not None else 0
         info_text = f"Showing {total_rows} of {all_rows} total records"
         if total_rows < all_rows:
             info_text += f" (filtered)"
         self.data_info_label.config(text=info_text)
 
+    def _append_data_rows(self):
+        """Start inserting the next page of windowed preview rows.
+
+        Only one insert stream may run at a time: rows go in at tk.END, so
+        a second stream started mid-page would interleave its rows ahead of
+        the remaining ones. A scroll arriving while a page is still
+        streaming just flags a top-up for when the page completes.
+        """
+        if self._data_insert_busy:
+            self._data_topup_wanted = True
+            return
+
+        rows = self._data_preview_rows
+        start = self._data_rows_inserted
+        if start >= len(rows):
+            return
+
+        end = min(start + DATA_TREE_PAGE, len(rows))
+        self._data_rows_inserted = end
+        self._data_insert_busy = True
+        self._insert_data_chunk(rows, start, end)
+
+    def _insert_data_chunk(self, rows, start, end):
+        """Insert up to DATA_INSERT_CHUNK rows, then yield to the event
+        loop with after_idle so expose/scroll events interleave with the
+        page fill instead of blocking behind it"""
+        if rows is not self._data_preview_rows:
+            return  # A newer refresh replaced the preview mid-stream
+
+        stop = min(start + DATA_INSERT_CHUNK, end)
+        for idx in range(start, stop):
+            values, no_email, dup = rows[idx]
+            tags = []
+            if no_email:
+                tags.append('no_email')
+            if dup:
+                tags.append('duplicate')
+            # iid doubles as the row's position within filtered_df, so
+            # detail lookups resolve without scanning the frame
+            self.data_tree.insert('', tk.END, iid=str(idx), values=values, tags=tuple(tags))
+
+        if stop < end:
+            self.root.after_idle(self._insert_data_chunk, rows, stop, end)
+            return
+
+        # Page complete; serve any top-up requested while it streamed
+        self._data_insert_busy = False
+        if self._data_topup_wanted:
+            self._data_topup_wanted = False
+            self._append_data_rows()
+
+    def _on_data_tree_scroll(self, first, last):
+        """Relay scroll state to the scrollbar, topping up the windowed
+        preview when the user nears the bottom"""
+        self._data_tree_yscroll(first, last)
+        if float(last) > 0.9:
+            self._append_data_rows()
+
     def sort_by_column(self, col):
         """Sort data by column"""
         if self.filtered_df is None:
@@ -1647,8 +2290,9 @@ TOP 10 MOST ENGAGED COMPANIES:
             messagebox.showwarning("No Data", "Please load data first")
             return
 
-        # Find duplicates
-        duplicates = self.df[self.df.duplicated(subset=['company_name', 'name', 'email_address'], keep=False)]
+        # Find duplicates (the keep=False mask is already cached per loaded
+        # frame for the preview highlights, so no second factorize pass)
+        duplicates = self.df[self._filter_masks()[1]]
 
         if len(duplicates) == 0:
             messagebox.showinfo("No Duplicates", "No duplicate records found!")
@@ -1688,37 +2332,67 @@ TOP 10 MOST ENGAGED COMPANIES:
         for col in ('Company', 'Name', 'Email', 'Submit Date'):
             dup_tree.column(col, width=150)
 
-        # Add duplicates
-        for idx, row in duplicates.iterrows():
-            dup_tree.insert('', tk.END, values=(
-                row.get('company_name', ''),
-                row.get('name', ''),
-                row.get('email_address', ''),
-                row.get('submitdate', '')
-            ))
+        # Add duplicates: one vectorized string pass, then plain tuples
+        # into the tree instead of a boxed Series per row
+        cols = ['company_name', 'name', 'email_address', 'submitdate']
+        sub = duplicates.reindex(columns=cols)
+        for values in sub.astype(str).where(sub.notna(), '').itertuples(index=False, name=None):
+            dup_tree.insert('', tk.END, values=values)
 
         dup_tree.pack(fill=tk.BOTH, expand=True)
 
         # Close button
         ttk.Button(dialog, text="Close", command=dialog.destroy).pack(pady=10)
 
+    @staticmethod
+    def _write_export_csv(df_out, filename):
+        """Write an export CSV in bounded chunks through a 1 MB buffer.
+
+        Handing to_csv a path gives it a default (8 KB) buffered file, so
+        big exports degrade into syscall-bound small writes; opening the
+        handle ourselves turns them into large sequential ones.
+        """
+        with open(filename, 'w', buffering=1 << 20, encoding='utf-8', newline='') as f:
+            df_out.to_csv(f, index=False, lineterminator='\n', chunksize=50000)
+
     def export_filtered_data(self):
-        """Export currently filtered data to CSV"""
+        """Export currently filtered data to Parquet, Feather or CSV"""
         if self.filtered_df is None or len(self.filtered_df) == 0:
             messagebox.showwarning("No Data", "No data to export")
             return
 
-        # Ask for filename
+        # Ask for filename (Parquet is smaller and much faster to write;
+        # CSV remains available for spreadsheet users)
         filename = filedialog.asksaveasfilename(
             title="Export Filtered Data",
-            defaultextension=".csv",
-            filetypes=[("CSV files", "*.csv"), ("All files", "*.*")],
-            initialfile=f"filtered_data_{datetime.now().strftime('%Y%m%d_%H%M')}.csv"
+            defaultextension=".parquet",
+            filetypes=[("Parquet files", "*.parquet"), ("Feather files", "*.feather"),
+                       ("CSV files", "*.csv"), ("All files", "*.*")],
+            initialfile=f"filtered_data_{datetime.now().strftime('%Y%m%d_%H%M')}.parquet"
         )
 
         if filename:
             try:
-                self.filtered_df.to_csv(filename, index=False)
+                # A filtered frame can carry a named or multi-level index;
+                # dropping it up front keeps the CSV writer on its fast
+                # flat-index path (and Feather requires a default index)
+                df_out = self.filtered_df
+                if isinstance(df_out.index, pd.MultiIndex) or df_out.index.name is not None:
+                    df_out = df_out.reset_index(drop=True)
+
+                lower = filename.lower()
+                if lower.endswith(('.parquet', '.feather')):
+                    try:
+                        if lower.endswith('.parquet'):
+                            df_out.to_parquet(filename, compression='zstd', index=False)
+                        else:
+                            df_out.reset_index(drop=True).to_feather(filename)
+                    except ImportError:
+                        # pyarrow missing: fall back to CSV next to the chosen name
+                        filename = filename.rsplit('.', 1)[0] + '.csv'
+                        self._write_export_csv(df_out, filename)
+                else:
+                    self._write_export_csv(df_out, filename)
                 messagebox.showinfo("Success", f"Exported {len(self.filtered_df)} records to:\n{filename}")
                 self.log(f"[OK] Exported {len(self.filtered_df)} records to {filename}")
             except Exception as e:
@@ -1731,44 +2405,44 @@ TOP 10 MOST ENGAGED COMPANIES:
         if not selection or self.filtered_df is None:
             return
 
-        # Get row index
-        item = selection[0]
-        row_values = self.data_tree.item(item)['values']
+        # The tree iid is the row's position within filtered_df (set during
+        # population), so the record is a direct positional lookup instead
+        # of a full-frame scan comparing stringified cells
+        try:
+            row = self.filtered_df.iloc[int(selection[0])]
+        except (ValueError, IndexError):
+            return
 
-        # Find matching row in dataframe
-        for idx, row in self.filtered_df.iterrows():
-            if all(str(row.get(col, '')) == str(val) for col, val in zip(self.visible_columns, row_values)):
-                # Create detail dialog
-                dialog = tk.Toplevel(self.root)
-                dialog.title("Record Details")
-                dialog.geometry("600x700")
+        # Create detail dialog
+        dialog = tk.Toplevel(self.root)
+        dialog.title("Record Details")
+        dialog.geometry("600x700")
 
-                # Scrollable text
-                text_frame = ttk.Frame(dialog)
-                text_frame.pack(fill=tk.BOTH, expand=True, padx=10, pady=10)
+        # Scrollable text
+        text_frame = ttk.Frame(dialog)
+        text_frame.pack(fill=tk.BOTH, expand=True, padx=10, pady=10)
 
-                scroll = ttk.Scrollbar(text_frame)
-                scroll.pack(side=tk.RIGHT, fill=tk.Y)
+        scroll = ttk.Scrollbar(text_frame)
+        scroll.pack(side=tk.RIGHT, fill=tk.Y)
 
-                detail_text = tk.Text(text_frame, wrap=tk.WORD, yscrollcommand=scroll.set, font=('Courier', 10))
-                detail_text.pack(fill=tk.BOTH, expand=True)
-                scroll.config(command=detail_text.yview)
+        detail_text = tk.Text(text_frame, wrap=tk.WORD, yscrollcommand=scroll.set, font=('Courier', 10))
+        detail_text.pack(fill=tk.BOTH, expand=True)
+        scroll.config(command=detail_text.yview)
 
-                # Add all fields
-                details = "=" * 60 + "\n"
-                details += "RECORD DETAILS\n"
-                details += "=" * 60 + "\n\n"
+        # Add all fields
+        details = "=" * 60 + "\n"
+        details += "RECORD DETAILS\n"
+        details += "=" * 60 + "\n\n"
 
-                for col in self.df.columns:
-                    value = row.get(col, '')
-                    details += f"{col}:\n  {value}\n\n"
+        for col in self.df.columns:
+            value = row.get(col, '')
+            details += f"{col}:\n  {value}\n\n"
 
-                detail_text.insert('1.0', details)
-                detail_text.config(state=tk.DISABLED)
+        detail_text.insert('1.0', details)
+        detail_text.config(state=tk.DISABLED)
 
-                # Close button
-                ttk.Button(dialog, text="Close", command=dialog.destroy).pack(pady=10)
-                break
+        # Close button
+        ttk.Button(dialog, text="Close", command=dialog.destroy).pack(pady=10)
 
     # ==================== Generation Methods ====================
 
@@ -1908,6 +2582,7 @@ TOP 10 MOST ENGAGED COMPANIES:
                 '-P', f'debug_mode={str(self.debug_mode_var.get()).lower()}',
                 '-P', f'diagnostic_mode={str(self.demo_mode_var.get()).lower()}',
                 '--to', 'pdf',
+                *QUARTO_PDF_ENGINE_ARGS,
                 '--output', temp_output
             ]
 
@@ -1978,6 +2653,8 @@ TOP 10 MOST ENGAGED COMPANIES:
 
     def start_generation_all(self):
         """Start generating all reports"""
+        self._ensure_tab_built(self.create_generation_tab)
+
         if self.df is None:
             messagebox.showwarning("Warning", "Please load data first")
             return
@@ -2051,6 +2728,90 @@ TOP 10 MOST ENGAGED COMPANIES:
         # All checks passed
         return {'is_valid': True, 'reason': 'Valid'}
 
+    def _compute_validity(self):
+        """Vectorized batch equivalent of validate_record_for_report.
+
+        Returns (valid, reasons): a boolean array and an object array of
+        per-row reasons. Each check runs as one column op over the whole
+        frame instead of Python-per-cell work per row, with the same
+        precedence as the per-row method (company, person, email, scores).
+        """
+        df = self.df
+        n = len(df)
+        valid = np.ones(n, dtype=bool)
+        reasons = np.full(n, 'Valid', dtype=object)
+
+        def mark(bad, reason):
+            bad = bad & valid
+            valid[bad] = False
+            reasons[bad] = reason
+            return bad
+
+        company = df['company_name'] if 'company_name' in df.columns else pd.Series(np.nan, index=df.index)
+        mark((company.isna() | company.astype(str).str.strip().isin(['', '-', 'Unknown'])).to_numpy(),
+             'No valid company name')
+
+        person = df['name'] if 'name' in df.columns else pd.Series(np.nan, index=df.index)
+        mark((person.isna() | person.astype(str).str.strip().eq('')).to_numpy(),
+             'No person name')
+
+        email = df['email_address'] if 'email_address' in df.columns else pd.Series(np.nan, index=df.index)
+        mark((email.isna() | ~email.astype(str).str.contains('@', regex=False)).to_numpy(),
+             'Invalid/missing email')
+
+        # Need at least 5 valid scores out of 15; count per column so each
+        # score column is one to_numeric pass (non-numeric and out-of-range
+        # values coerce to NaN and drop out of the count)
+        score_columns = ['up__r', 'up__c', 'up__f', 'up__v', 'up__a',
+                         'in__r', 'in__c', 'in__f', 'in__v', 'in__a',
+                         'do__r', 'do__c', 'do__f', 'do__v', 'do__a']
+        counts = np.zeros(n, dtype=int)
+        for col in score_columns:
+            if col not in df.columns:
+                continue
+            num = pd.to_numeric(df[col].astype(str).str.replace(',', '.', regex=False),
+                                errors='coerce')
+            counts += ((num >= 0) & (num <= 5)).to_numpy()
+
+        insufficient = mark(counts < 5, '')
+        for pos in np.nonzero(insufficient)[0]:
+            reasons[pos] = f'Insufficient data ({counts[pos]}/15 scores, need 5)'
+
+        return valid, reasons
+
+    def _get_render_pool(self):
+        """Return the persistent render worker pool, creating it on demand.
+
+        The pool outlives individual generation runs so repeated batches
+        reuse already-started worker processes instead of paying process
+        startup per run. It is torn down in shutdown_workers() when the
+        app exits.
+        """
+        if self._render_pool is None:
+            # Half the cores (each quarto spawns its own engine process),
+            # hard-capped at 8 so big machines don't blow up on RAM
+            max_workers = max(1, min(8, (os.cpu_count() or 2) // 2))
+            self._render_pool = ProcessPoolExecutor(max_workers=max_workers)
+        return self._render_pool
+
+    def shutdown_workers(self):
+        """Tear down the persistent worker pool on app exit"""
+        if self._render_pool is not None:
+            self._render_pool.shutdown(wait=False, cancel_futures=True)
+            self._render_pool = None
+
+        # Remove the per-worker template copies (and any knitr leftovers
+        # named after them) that render workers staged next to the source
+        import shutil
+        for leftover in ROOT_DIR.glob('temp_worker_*'):
+            try:
+                if leftover.is_dir():
+                    shutil.rmtree(leftover)
+                else:
+                    leftover.unlink()
+            except OSError:
+                pass
+
     def generate_reports_thread(self):
         """Background thread for report generation"""
         self.log_gen("[START] Starting batch report generation...")
@@ -2063,138 +2824,126 @@ TOP 10 MOST ENGAGED COMPANIES:
         self.gen_progress['maximum'] = total
         self.gen_progress['value'] = 0
 
-        for idx, row in self.df.iterrows():
-            try:
+        template = self.template_var.get()
+        debug_mode = str(self.debug_mode_var.get()).lower()
+        diagnostic_mode = str(self.demo_mode_var.get()).lower()
+
+        # Pre-generation validation: one vectorized pass over the frame,
+        # then only records with sufficient data are dispatched to the
+        # worker pool.
+        valid, reasons = self._compute_validity()
+        companies = (self.df['company_name'].to_numpy()
+                     if 'company_name' in self.df.columns else np.full(total, 'Unknown'))
+        for pos in np.nonzero(~valid)[0]:
+            self.log_gen(f"[{pos+1}/{total}] [SKIP] Skipping {companies[pos]}: {reasons[pos]}")
+            skipped += 1
+        jobs = self.df[valid].to_dict('records')
+
+        # Skip rows whose PDF already exists from a prior (partial) run, so
+        # a restart only pays for the remaining reports.
+        force = self.force_regenerate_var.get()
+        if not force and REPORTS_DIR.exists():
+            existing = {p.name for p in REPORTS_DIR.glob('*.pdf')}
+            todo = [job for job in jobs if _pdf_name_for(job, template) not in existing]
+            already_done = len(jobs) - len(todo)
+            if already_done:
+                self.log_gen(
+                    f"[SKIP] {already_done} report(s) already exist - skipping "
+                    f"(enable Force Regenerate to redo them)"
+                )
+                success += already_done
+                jobs = todo
+
+        # Duplicate rows map to the same temp and final filenames, so two
+        # workers would race each other rendering them; keep the first of
+        # each output name (the duplicates dialog exists because such rows
+        # do occur in practice).
+        seen_names = set()
+        unique_jobs = []
+        for job in jobs:
+            name = _pdf_name_for(job, template)
+            if name in seen_names:
+                skipped += 1
+                self.log_gen(f"[SKIP] Duplicate record for "
+                             f"{job.get('company_name', 'Unknown')} - report already queued")
+                continue
+            seen_names.add(name)
+            unique_jobs.append(job)
+        jobs = unique_jobs
+
+        # Group same-company respondents together so consecutive renders hit
+        # warm company-level data (sort is stable, so submission order is
+        # preserved within a company).
+        jobs.sort(key=lambda r: str(r.get('company_name', '')))
+
+        # Quarto rendering is CPU-bound (R + LaTeX), so fan the renders out
+        # across the persistent worker pool instead of shelling out serially
+        # per row.
+        processed = total - len(jobs)
+        executor = self._get_render_pool()
+        futures = []
+        try:
+            futures = [
+                executor.submit(_render_one, job, template, debug_mode, diagnostic_mode, force)
+                for job in jobs
+            ]
+            last_progress = 0.0
+            for future in as_completed(futures):
                 if not self.is_generating:
                     self.log_gen("Generation cancelled by user")
                     break
 
-                company = row.get('company_name', 'Unknown')
-                person = row.get('name', 'Unknown')
-
-                # Handle potential encoding issues in GUI labels
                 try:
-                    display_text = f"Generating: {company} - {person}"
-                    self.gen_current_label.config(text=display_text)
-                except (UnicodeDecodeError, UnicodeEncodeError):
-                    # Fallback to safe ASCII if encoding fails
-                    safe_company = company.encode('ascii', 'replace').decode('ascii')
-                    safe_person = person.encode('ascii', 'replace').decode('ascii')
-                    self.gen_current_label.config(text=f"Generating: {safe_company} - {safe_person}")
-                # Pre-generation validation: Check if record has sufficient data
-                validation_result = self.validate_record_for_report(row)
-
-                if not validation_result['is_valid']:
-                    self.log_gen(f"[{idx+1}/{total}] [SKIP] Skipping {company}: {validation_result['reason']}")
-                    skipped += 1
+                    result = future.result()
+                except Exception as e:
+                    failed += 1
+                    processed += 1
+                    self.log_gen(f"[{processed}/{total}] CRITICAL ERROR: {e}")
                     continue
 
-                self.log_gen(f"[{idx+1}/{total}] Generating: {company} - {person}")
-
-                # Create safe filenames
-                def safe_filename(name):
-                    if pd.isna(name) or name == "":
-                        return "Unknown"
-                    return "".join(c if c.isalnum() or c in [' ', '-'] else "_" for c in str(name)).replace(" ", "_")
-
-                def safe_display_name(name):
-                    if pd.isna(name) or name == "":
-                        return "Unknown"
-                    name_str = str(name).strip()
-                    name_str = name_str.replace("/", "-").replace("\\", "-").replace(":", "-")
-                    name_str = name_str.replace("*", "").replace("?", "").replace('"', "'")
-                    name_str = name_str.replace("<", "(").replace(">", ")").replace("|", "-")
-                    return name_str
-
-                safe_company = safe_filename(company)
-                safe_person = safe_filename(person)
-                display_company = safe_display_name(company)
-                display_person = safe_display_name(person)
-
-                # Output filename with template name
-                from datetime import datetime
-                date_str = datetime.now().strftime("%Y%m%d")
-
-                # Extract report name from template path
-                template_name = Path(self.template_var.get()).stem  # Gets filename without extension
-                if template_name.startswith("Report"):
-                    # For report variations, use the full name (e.g., "Report1_CircularBarplot")
-                    report_name = template_name
-                else:
-                    # For standard reports, use the template name as is
-                    report_name = template_name
-
-                output_filename = f"{date_str} {report_name} ({display_company} - {display_person}).pdf"
-                output_file = REPORTS_DIR / output_filename
+                processed += 1
+                company = result['company']
+                person = result['person']
 
-                # Check if already exists
-                if output_file.exists():
-                    self.log_gen(f"  [SKIP] Already exists, skipping")
+                if result['status'] == 'exists':
+                    self.log_gen(f"[{processed}/{total}] [SKIP] {company} - {person}: Already exists, skipping")
                     success += 1
-                    continue
-
-                # Build quarto command using selected template with both company and person
-                selected_template = ROOT_DIR / self.template_var.get()
-                temp_output = f"temp_{safe_company}_{safe_person}.pdf"
-                cmd = [
-                    'quarto', 'render', str(selected_template),
-                    '-P', f'company={company}',
-                    '-P', f'person={person}',
-                    '-P', f'debug_mode={str(self.debug_mode_var.get()).lower()}',
-                    '-P', f'diagnostic_mode={str(self.demo_mode_var.get()).lower()}',
-                    '--to', 'pdf',
-                    '--output', temp_output
-                    # Removed --quiet to capture error details
-                ]
+                elif result['status'] == 'success':
+                    self.log_gen(f"[{processed}/{total}] [OK] Success: {result['output_filename']}")
 
-                # Execute quarto render
-                result = subprocess.run(cmd, cwd=ROOT_DIR, capture_output=True, text=True, timeout=300)
+                    # Validate the generated report
+                    try:
+                        from validate_single_report import validate_report
+                        validation_result = validate_report(
+                            pdf_path=result['output_file'],
+                            csv_path=str(DATA_FILE),
+                            company_name=company,
+                            person_name=person
+                        )
 
-                if result.returncode == 0:
-                    temp_path = ROOT_DIR / temp_output
-                    if temp_path.exists():
-                        import shutil
-                        shutil.move(str(temp_path), str(output_file))
-                        self.log_gen(f"  [OK] Success: {output_filename}")
-
-                        # Validate the generated report
-                        try:
-                            from validate_single_report import validate_report
-                            validation_result = validate_report(
-                                pdf_path=str(output_file),
-                                csv_path=str(DATA_FILE),
-                                company_name=company,
-                                person_name=person
-                            )
+                        if validation_result['success']:
+                            self.log_gen(f"  [OK] Validation passed: All values match CSV")
+                        else:
+                            self.log_gen(f"  [WARNING] Validation: {validation_result['message']}")
+                            # Log details
+                            for key, info in validation_result.get('details', {}).items():
+                                if not info['matches']:
+                                    exp = f"{info['expected']:.2f}" if info.get('expected') is not None else "N/A"
+                                    act = f"{info['actual']:.2f}" if info.get('actual') is not None else "N/A"
+                                    self.log_gen(f"      {info['label']}: Expected={exp}, Actual={act}")
+                    except Exception as ve:
+                        self.log_gen(f"  [INFO] Validation skipped: {ve}")
 
-                            if validation_result['success']:
-                                self.log_gen(f"  [OK] Validation passed: All values match CSV")
-                            else:
-                                self.log_gen(f"  [WARNING] Validation: {validation_result['message']}")
-                                # Log details
-                                for key, info in validation_result.get('details', {}).items():
-                                    if not info['matches']:
-                                        exp = f"{info['expected']:.2f}" if info.get('expected') is not None else "N/A"
-                                        act = f"{info['actual']:.2f}" if info.get('actual') is not None else "N/A"
-                                        self.log_gen(f"      {info['label']}: Expected={exp}, Actual={act}")
-                        except Exception as ve:
-                            self.log_gen(f"  [INFO] Validation skipped: {ve}")
-
-                        success += 1
-                    else:
-                        self.log_gen(f"  [ERROR] Error: Output file not found")
-                        if result.stderr:
-                            self.log_gen(f"     stderr: {result.stderr[-500:]}")
-                        if result.stdout:
-                            self.log_gen(f"     stdout: {result.stdout[-500:]}")
-                        failed += 1
+                    success += 1
                 else:
-                    self.log_gen(f"  [ERROR] Error: Exit code {result.returncode}")
+                    failed += 1
+                    self.log_gen(f"[{processed}/{total}] [ERROR] Error: {result['detail']}")
 
                     # Show stderr (last 800 chars for readability)
                     error_shown = False
-                    if result.stderr and result.stderr.strip():
-                        error_text = result.stderr[-800:] if len(result.stderr) > 800 else result.stderr
+                    stderr = result['stderr']
+                    if stderr and stderr.strip():
+                        error_text = stderr[-800:] if len(stderr) > 800 else stderr
                         # Split into lines and indent
                         for line in error_text.strip().split('\n'):
                             if line.strip():
@@ -2202,9 +2951,10 @@ TOP 10 MOST ENGAGED COMPANIES:
                                 error_shown = True
 
                     # Show stdout if stderr is empty or short
-                    if result.stdout and result.stdout.strip():
-                        if not result.stderr or len(result.stderr) < 100:
-                            stdout_text = result.stdout[-500:] if len(result.stdout) > 500 else result.stdout
+                    stdout = result['stdout']
+                    if stdout and stdout.strip():
+                        if not stderr or len(stderr) < 100:
+                            stdout_text = stdout[-500:] if len(stdout) > 500 else stdout
                             self.log_gen(f"     stdout: {stdout_text}")
                             error_shown = True
 
@@ -2213,33 +2963,23 @@ TOP 10 MOST ENGAGED COMPANIES:
                         self.log_gen(f"     No error details available from quarto")
                         self.log_gen(f"     Company: {company}, Person: {person}")
 
-                    failed += 1
-
-            except FileNotFoundError as e:
-                failed += 1
-                self.log_gen(f"  [ERROR] Error: Quarto not found - please install from https://quarto.org")
-            except subprocess.TimeoutExpired:
-                failed += 1
-                self.log_gen(f"  [ERROR] Error: Generation timeout (>5 minutes)")
-            except Exception as e:
-                failed += 1
-                self.log_gen(f"  [ERROR] Error: {e}")
-
-                self.gen_progress['value'] = idx + 1
-                self.gen_progress_label.config(
-                    text=f"Progress: {idx+1}/{total} | Success: {success} | Failed: {failed} | Skipped: {skipped}"
-                )
+                # Progress widgets are throttled to ~10 Hz and written on
+                # the main thread: Tk is not thread-safe, and redrawing per
+                # completion would outpace the event loop on fast batches.
+                now = time.monotonic()
+                if processed == total or now - last_progress > 0.1:
+                    last_progress = now
+                    self.root.after(0, self._update_gen_progress, processed, total,
+                                    success, failed, skipped, f"{company} - {person}")
+        finally:
+            # On cancel (or early exit), drop renders that have not started
+            # yet but keep the pool itself alive for the next run.
+            for future in futures:
+                future.cancel()
 
-            except Exception as e:
-                # Catch-all for ANY exception in loop (including encoding errors, etc)
-                failed += 1
-                self.log_gen(f"[{idx+1}/{total}] CRITICAL ERROR: {e}")
-                self.log_gen(f"     Company: {row.get('company_name', 'Unknown')}, Person: {row.get('name', 'Unknown')}")
-                # Continue processing next record despite error
-                self.gen_progress['value'] = idx + 1
-                self.gen_progress_label.config(
-                    text=f"Progress: {idx+1}/{total} | Success: {success} | Failed: {failed} | Skipped: {skipped}"
-                )
+        # Make sure the last throttled tick reflects the final counts
+        self.root.after(0, self._update_gen_progress, processed, total,
+                        success, failed, skipped, None)
 
         self.is_generating = False
         self.gen_start_btn.config(state=tk.NORMAL)
@@ -2277,6 +3017,21 @@ TOP 10 MOST ENGAGED COMPANIES:
             self.log_gen(f"   These records don't have enough scores to generate a valid report.")
             self.log_gen(f"   Run 'Clean Data' to see details about removed/insufficient records.")
 
+    def _update_gen_progress(self, processed, total, success, failed, skipped, who):
+        """Write generation progress to the Tk widgets (main thread only)"""
+        if who is not None:
+            try:
+                self.gen_current_label.config(text=f"Generated: {who}")
+            except (UnicodeDecodeError, UnicodeEncodeError):
+                # Fallback to safe ASCII if encoding fails
+                safe_who = who.encode('ascii', 'replace').decode('ascii')
+                self.gen_current_label.config(text=f"Generated: {safe_who}")
+
+        self.gen_progress.configure(value=processed)
+        self.gen_progress_label.config(
+            text=f"Progress: {processed}/{total} | Success: {success} | Failed: {failed} | Skipped: {skipped}"
+        )
+
     def cancel_generation(self):
         """Cancel generation"""
         if messagebox.askyesno("Confirm", "Cancel report generation?"):
@@ -2295,23 +3050,49 @@ TOP 10 MOST ENGAGED COMPANIES:
         """Generate executive dashboard PDF"""
         self.log("Generating Executive Dashboard...")
         self.status_label.config(text="Generating Executive Dashboard...")
+        threading.Thread(target=self._dashboard_render_thread, daemon=True).start()
 
-        try:
-            cmd = ['quarto', 'render', 'ExecutiveDashboard.qmd', '--to', 'pdf']
-            result = subprocess.run(cmd, cwd=ROOT_DIR, capture_output=True, text=True)
+    def _dashboard_render_thread(self):
+        """Render the dashboard, streaming quarto's output into the log.
 
-            if result.returncode == 0:
-                self.log("[OK] Executive Dashboard generated successfully")
-                messagebox.showinfo("Success", "Executive Dashboard generated!\n\nSaved as: ExecutiveDashboard.pdf")
-            else:
-                self.log(f"[ERROR] Error generating dashboard: {result.stderr}")
-                messagebox.showerror("Error", f"Failed to generate dashboard:\n{result.stderr}")
+        A long xelatex run can produce a lot of log output; reading the
+        pipe line by line keeps memory bounded and shows where a slow
+        render is stuck, instead of blocking the GUI on capture_output.
+        """
+        cmd = ['quarto', 'render', 'ExecutiveDashboard.qmd', '--to', 'pdf',
+               *QUARTO_PDF_ENGINE_ARGS]
+        tail = deque(maxlen=15)
 
+        try:
+            proc = subprocess.Popen(cmd, cwd=ROOT_DIR, stdout=subprocess.PIPE,
+                                    stderr=subprocess.STDOUT, text=True, bufsize=1)
+            for line in proc.stdout:
+                line = line.rstrip()
+                if line:
+                    self.log(f"  [dashboard] {line}")
+                    tail.append(line)
+            returncode = proc.wait()
         except Exception as e:
             self.log(f"[ERROR] Error: {e}")
-            messagebox.showerror("Error", f"Failed to generate dashboard:\n{e}")
-        finally:
+
+            def report_exception(error=e):
+                self.status_label.config(text="Ready")
+                messagebox.showerror("Error", f"Failed to generate dashboard:\n{error}")
+            self.root.after(0, report_exception)
+            return
+
+        def report_result():
             self.status_label.config(text="Ready")
+            if returncode == 0:
+                messagebox.showinfo("Success", "Executive Dashboard generated!\n\nSaved as: ExecutiveDashboard.pdf")
+            else:
+                messagebox.showerror("Error", "Failed to generate dashboard:\n" + "\n".join(tail))
+
+        if returncode == 0:
+            self.log("[OK] Executive Dashboard generated successfully")
+        else:
+            self.log(f"[ERROR] Error generating dashboard (exit code {returncode})")
+        self.root.after(0, report_result)
 
     def run_system_check(self):
         """Run system check and display results"""
@@ -2320,6 +3101,7 @@ TOP 10 MOST ENGAGED COMPANIES:
 
         try:
             # Run system check
+            from gui_system_check import SystemChecker
             checker = SystemChecker(ROOT_DIR)
             all_ok = checker.check_all()
 
@@ -2499,6 +3281,7 @@ TOP 10 MOST ENGAGED COMPANIES:
         self.status_label.config(text="Installing dependencies...")
 
         try:
+            from dependency_manager import DependencyManager
             manager = DependencyManager()
             checks = manager.check_all()
 
@@ -2642,17 +3425,9 @@ TOP 10 MOST ENGAGED COMPANIES:
         from datetime import datetime
         sample_date = datetime.now().strftime('%Y-%m-%d')
 
-        subject = subject_template.format(
-            company=sample_company,
-            name=sample_name,
-            date=sample_date
-        )
-
-        body = body_template.format(
-            company=sample_company,
-            name=sample_name,
-            date=sample_date
-        )
+        fields = _SafeDict(company=sample_company, name=sample_name, date=sample_date)
+        subject = subject_template.format_map(fields)
+        body = body_template.format_map(fields)
 
         # Find report file
         from pathlib import Path
@@ -2713,11 +3488,14 @@ TOP 10 MOST ENGAGED COMPANIES:
 
     def update_email_status_display(self):
         """Update email status treeview - ONLY shows companies with generated PDF reports"""
+        # The Email tab is built lazily; nothing to refresh until then
+        if not hasattr(self, 'email_status_tree'):
+            return
+
         # Load CSV data if not already loaded
         if self.df is None and DATA_FILE.exists():
             try:
-                self.df = pd.read_csv(DATA_FILE)
-                self.df.columns = self.df.columns.str.lower().str.strip()
+                self._reload_data_file()
                 self.log_email("[LOAD] Loaded CSV data for email display")
             except Exception as e:
                 self.log_email(f"[WARNING] Could not load CSV: {e}")
@@ -2726,15 +3504,65 @@ TOP 10 MOST ENGAGED COMPANIES:
         for item in self.email_status_tree.get_children():
             self.email_status_tree.delete(item)
 
-        # Scan /reports folder for PDF files
-        import glob
-        report_files = glob.glob(str(REPORTS_DIR / "*.pdf"))
+        # The expensive part is globbing /reports and the per-file CSV
+        # lookups, which go stale when a PDF appears, the reportsent
+        # column is written, or self.df is rebound by a reload — so the
+        # parsed scan is cached in per-status buckets keyed on both the
+        # directory mtime and the frame identity, and filter switches are
+        # an O(1) bucket lookup.
+        try:
+            dir_mtime = REPORTS_DIR.stat().st_mtime_ns
+        except OSError:
+            dir_mtime = None
 
-        if not report_files:
+        if (self._email_scan_cache is None or self._email_scan_mtime != dir_mtime
+                or self._email_scan_df is not self.df):
+            self._email_scan_cache = self._scan_email_reports()
+            self._email_scan_mtime = dir_mtime
+            self._email_scan_df = self.df
+
+        buckets = self._email_scan_cache
+
+        if not buckets['all']:
             self.log_email("[INFO] No PDF reports found in /reports folder")
             self.email_stats_label.config(text="No PDF reports found - generate reports first")
             return
 
+        # Update statistics
+        total = len(buckets['all'])
+        pending = len(buckets['pending'])
+        sent = len(buckets['sent'])
+
+        self.email_stats_label.config(
+            text=f"Reports Ready: {total} | Pending: {pending} | Sent: {sent}"
+        )
+
+        # Filter is a straight bucket lookup on the cached scan
+        filter_status = self.email_filter_var.get()
+        reports_ready = buckets.get(filter_status, buckets['all'])
+
+        # Keep the full record list in Python and window the widget: only
+        # the first page of rows is inserted here, and scrolling near the
+        # bottom tops the view up (see _on_email_tree_scroll). The tree is
+        # unmapped and its scrollbar detached for the bulk insert so Tk
+        # skips intermediate layout and redraw work.
+        self._email_reports = reports_ready
+        self._email_rows_inserted = 0
+
+        self.email_status_tree.pack_forget()
+        self.email_status_tree.configure(yscrollcommand='')
+        try:
+            self._append_email_rows()
+        finally:
+            self.email_status_tree.configure(yscrollcommand=self._on_email_tree_scroll)
+            self.email_status_tree.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
+            self.email_status_tree.yview_moveto(0)
+
+    def _scan_email_reports(self):
+        """Scan /reports and bucket the parsed records by sent status"""
+        import glob
+        report_files = glob.glob(str(REPORTS_DIR / "*.pdf"))
+
         # Parse PDF filenames to extract company and person info
         # Format: YYYYMMDD ResilienceScanReport (COMPANY - PERSON).pdf
         reports_ready = []
@@ -2758,28 +3586,16 @@ TOP 10 MOST ENGAGED COMPANIES:
                     # Split by " - " to get company and person
                     company, person = content.rsplit(" - ", 1)
 
-                    # Look up email address from CSV data
+                    # Resolve email and sent status with one dict probe
+                    # instead of boolean column scans per file
                     email = ""
-                    if self.df is not None:
-                        # Find matching record
-                        matches = self.df[
-                            (self.df['company_name'].str.strip() == company.strip()) &
-                            (self.df['name'].str.strip() == person.strip())
-                        ]
-                        if not matches.empty:
-                            email = matches.iloc[0].get('email_address', '')
-
-                    # Check if already sent (from CSV reportsent column)
                     sent_status = "pending"
                     if self.df is not None:
-                        matches = self.df[
-                            (self.df['company_name'].str.strip() == company.strip()) &
-                            (self.df['name'].str.strip() == person.strip())
-                        ]
-                        if not matches.empty and 'reportsent' in self.df.columns:
-                            is_sent = matches.iloc[0].get('reportsent', False)
-                            if is_sent:
-                                sent_status = "sent"
+                        email, is_sent = self._respondent_lookup().get(
+                            (company.strip(), person.strip()), ("", False)
+                        )
+                        if is_sent:
+                            sent_status = "sent"
 
                     reports_ready.append({
                         'company': company,
@@ -2792,45 +3608,76 @@ TOP 10 MOST ENGAGED COMPANIES:
                 self.log_email(f"[WARNING] Could not parse filename: {filename} - {e}")
                 continue
 
-        # Update statistics
-        total = len(reports_ready)
-        pending = sum(1 for r in reports_ready if r['status'] == 'pending')
-        sent = sum(1 for r in reports_ready if r['status'] == 'sent')
+        return {
+            'all': reports_ready,
+            'pending': [r for r in reports_ready if r['status'] == 'pending'],
+            'sent': [r for r in reports_ready if r['status'] == 'sent'],
+        }
 
-        self.email_stats_label.config(
-            text=f"Reports Ready: {total} | Pending: {pending} | Sent: {sent}"
-        )
+    def _invalidate_email_scan(self):
+        """Drop caches derived from reportsent (call after writing it)"""
+        self._email_scan_cache = None
+        self._lookup_cache_df = None
 
-        # Get filter value
-        filter_status = self.email_filter_var.get()
+    def _respondent_lookup(self):
+        """dict[(company, person)] -> (email, reportsent) for O(1) probes.
 
-        # Display reports
-        for report in reports_ready:
-            # Apply filter
-            if filter_status != "all" and report['status'] != filter_status:
-                continue
+        The email paths resolve each PDF back to a respondent; doing that
+        with boolean column comparisons costs two full scans per file. This
+        builds the index once per loaded frame (first occurrence wins, same
+        as the old .iloc[0]) and the reportsent writers invalidate it.
+        """
+        if self._lookup_cache_df is not self.df or self._lookup_cache is None:
+            companies = self.df['company_name'].astype(str).str.strip().tolist()
+            names = self.df['name'].astype(str).str.strip().tolist()
+            if 'email_address' in self.df.columns:
+                emails = self.df['email_address'].tolist()
+            else:
+                emails = [''] * len(self.df)
+            if 'reportsent' in self.df.columns:
+                sent_flags = self.df['reportsent'].tolist()
+            else:
+                sent_flags = [False] * len(self.df)
+
+            lookup = {}
+            for company, person, email, sent in zip(companies, names, emails, sent_flags):
+                lookup.setdefault((company, person), (email, sent))
+
+            self._lookup_cache = lookup
+            self._lookup_cache_df = self.df
+        return self._lookup_cache
 
-            # Insert into tree with tag for color coding
+    def _append_email_rows(self):
+        """Insert the next page of windowed email rows, if any remain"""
+        reports = self._email_reports
+        start = self._email_rows_inserted
+        if start >= len(reports):
+            return
+
+        for idx, report in enumerate(reports[start:start + EMAIL_TREE_PAGE], start=start):
+            # Single insert per row, status tag included up-front. The iid
+            # is the index into _email_reports so selection handlers can get
+            # back to the record without reading row values out of Tk.
+            company, person, email, status = _email_row_getter(report)
             values = (
-                report['company'],
-                report['person'],
-                report['email'] if report['email'] else "NO EMAIL",
-                report['status'].upper(),
+                company,
+                person,
+                email if email else "NO EMAIL",
+                status.upper(),
                 "",  # No date for pending
                 ""   # No mode needed
             )
+            tag = 'sent' if status == 'sent' else 'pending'
+            self.email_status_tree.insert('', tk.END, iid=str(idx), values=values, tags=(tag,))
 
-            item = self.email_status_tree.insert('', tk.END, values=values)
-
-            # Color code by status
-            if report['status'] == 'sent':
-                self.email_status_tree.item(item, tags=('sent',))
-            else:
-                self.email_status_tree.item(item, tags=('pending',))
+        self._email_rows_inserted = min(start + EMAIL_TREE_PAGE, len(reports))
 
-        # Configure tag colors
-        self.email_status_tree.tag_configure('sent', foreground='green')
-        self.email_status_tree.tag_configure('pending', foreground='orange')
+    def _on_email_tree_scroll(self, first, last):
+        """Relay scroll state to the scrollbar, topping up the windowed
+        email list when the user nears the bottom"""
+        self._email_tree_yscroll(first, last)
+        if float(last) > 0.9:
+            self._append_email_rows()
 
     def mark_as_sent_in_csv(self, company, person):
         """Mark a report as sent in the CSV file"""
@@ -2841,59 +3688,76 @@ TOP 10 MOST ENGAGED COMPANIES:
                        (self.df['name'].str.strip() == person.strip())
                 self.df.loc[mask, 'reportsent'] = True
 
-                # Save back to CSV file
+                # Save back to CSV file. self.df was already updated in
+                # place above, so no reread is needed here — finalize()
+                # reloads once after the whole send batch
                 self.df.to_csv(DATA_FILE, index=False)
 
-                # Reload the CSV to ensure we have the latest data
-                self.df = pd.read_csv(DATA_FILE)
-                self.df.columns = self.df.columns.str.lower().str.strip()
-
+                self._invalidate_email_scan()
                 self.log_email(f"  [UPDATE] Updated CSV: {company} - {person} marked as sent")
         except Exception as e:
             self.log_email(f"  [WARNING] Could not update CSV: {e}")
 
-    def mark_selected_as_sent(self):
-        """Mark selected email as sent"""
+    def _set_reportsent_in_csv(self, pairs, value):
+        """Apply one reportsent update for many (company, person) pairs.
+
+        Builds a single combined mask and writes the CSV once, instead of
+        one save (and reload) round-trip per selected row.
+        """
+        if self.df is None or 'reportsent' not in self.df.columns or not pairs:
+            return 0
+
+        try:
+            wanted = [(str(c).strip(), str(p).strip()) for c, p in pairs]
+            keys = pd.MultiIndex.from_arrays([
+                self.df['company_name'].str.strip(),
+                self.df['name'].str.strip(),
+            ])
+            mask = keys.isin(wanted)
+            self.df.loc[mask, 'reportsent'] = value
+
+            # Save back to CSV file
+            self.df.to_csv(DATA_FILE, index=False)
+            self._invalidate_email_scan()
+            return int(mask.sum())
+        except Exception as e:
+            self.log_email(f"[WARNING] Could not update CSV: {e}")
+            return 0
+
+    def _selected_email_pairs(self):
+        """Collect (company, person) pairs from the current tree selection"""
         selection = self.email_status_tree.selection()
         if not selection:
             messagebox.showwarning("Warning", "Please select an email record first")
-            return
+            return []
 
-        for item in selection:
-            values = self.email_status_tree.item(item)['values']
-            company, person, email = values[0], values[1], values[2]
+        # Row iids index straight into _email_reports, so no values-based
+        # lookup (one Tk call per row) is needed to recover the records
+        pairs = []
+        for iid in selection:
+            report = self._email_reports[int(iid)]
+            pairs.append((report['company'], report['person']))
+        return pairs
 
-            # Update in CSV
-            self.mark_as_sent_in_csv(company, person)
+    def mark_selected_as_sent(self):
+        """Mark selected emails as sent in one batched update"""
+        pairs = self._selected_email_pairs()
+        if not pairs:
+            return
 
+        self._set_reportsent_in_csv(pairs, True)
         self.update_email_status_display()
-        self.log_email(f"[OK] Marked {len(selection)} record(s) as sent")
+        self.log_email(f"[OK] Marked {len(pairs)} record(s) as sent")
 
     def mark_selected_as_pending(self):
-        """Reset selected email to pending"""
-        selection = self.email_status_tree.selection()
-        if not selection:
-            messagebox.showwarning("Warning", "Please select an email record first")
+        """Reset selected emails to pending in one batched update"""
+        pairs = self._selected_email_pairs()
+        if not pairs:
             return
 
-        for item in selection:
-            values = self.email_status_tree.item(item)['values']
-            company, person, email = values[0], values[1], values[2]
-
-            # Reset in CSV by setting reportsent to False
-            try:
-                if self.df is not None and 'reportsent' in self.df.columns:
-                    mask = (self.df['company_name'].str.strip() == company.strip()) & \
-                           (self.df['name'].str.strip() == person.strip())
-                    self.df.loc[mask, 'reportsent'] = False
-
-                    # Save back to CSV file
-                    self.df.to_csv(DATA_FILE, index=False)
-            except Exception as e:
-                self.log_email(f"[WARNING] Could not update CSV: {e}")
-
+        self._set_reportsent_in_csv(pairs, False)
         self.update_email_status_display()
-        self.log_email(f"[RESET] Reset {len(selection)} record(s) to pending")
+        self.log_email(f"[RESET] Reset {len(pairs)} record(s) to pending")
 
     def toggle_test_mode(self):
         """Toggle test mode for emails"""
@@ -2904,6 +3768,8 @@ TOP 10 MOST ENGAGED COMPANIES:
 
     def start_email_all(self):
         """Start sending all emails with prerequisite checks"""
+        self._ensure_tab_built(self.create_email_tab)
+
         if self.df is None:
             messagebox.showwarning("Warning", "Please load data first")
             return
@@ -3066,25 +3932,14 @@ TOP 10 MOST ENGAGED COMPANIES:
                 if content and " - " in content:
                     company, person = content.rsplit(" - ", 1)
 
-                    # Look up email address from CSV data
+                    # Resolve email and sent status with one dict probe
+                    # instead of boolean column scans per file
                     email = ""
-                    if self.df is not None:
-                        matches = self.df[
-                            (self.df['company_name'].str.strip() == company.strip()) &
-                            (self.df['name'].str.strip() == person.strip())
-                        ]
-                        if not matches.empty:
-                            email = matches.iloc[0].get('email_address', '')
-
-                    # Check if already sent (from CSV reportsent column)
                     is_sent = False
-                    if self.df is not None and 'reportsent' in self.df.columns:
-                        matches = self.df[
-                            (self.df['company_name'].str.strip() == company.strip()) &
-                            (self.df['name'].str.strip() == person.strip())
-                        ]
-                        if not matches.empty:
-                            is_sent = matches.iloc[0].get('reportsent', False)
+                    if self.df is not None:
+                        email, is_sent = self._respondent_lookup().get(
+                            (company.strip(), person.strip()), ("", False)
+                        )
 
                     # Only add if not sent yet
                     if not is_sent:
@@ -3118,264 +3973,96 @@ TOP 10 MOST ENGAGED COMPANIES:
         sent_count = 0
         failed_count = 0
 
-        # Initialize SMTP connection
-        smtp_server = self.smtp_server_var.get()
-        smtp_port = int(self.smtp_port_var.get())
-        smtp_username = self.smtp_username_var.get()
-        smtp_password = self.smtp_password_var.get()
-        smtp_from = self.smtp_from_var.get()
-
-        self.log_email(f"[SMTP] Connecting to SMTP server: {smtp_server}:{smtp_port}")
+        # SMTP settings (connection is created per-email to avoid timeouts)
+        smtp_config = {
+            'server': self.smtp_server_var.get(),
+            'port': int(self.smtp_port_var.get()),
+            'username': self.smtp_username_var.get(),
+            'password': self.smtp_password_var.get(),
+            'from': self.smtp_from_var.get(),
+        }
 
-        # Note: SMTP connection will be created per-email to avoid timeout issues
+        self.log_email(f"[SMTP] SMTP server: {smtp_config['server']}:{smtp_config['port']}")
 
         # Get email template
         subject_template = self.email_subject_var.get()
         body_template = self.email_body_text.get('1.0', tk.END).strip()
 
+        # Flag placeholders outside the supported set once, up front,
+        # instead of silently sending them as literal text N times
+        unknown_fields = (set(TEMPLATE_FIELD_RE.findall(subject_template + body_template))
+                          - TEMPLATE_FIELDS)
+        if unknown_fields:
+            self.log_email(f"[WARN] Unknown template placeholders sent as-is: "
+                           f"{', '.join('{%s}' % f for f in sorted(unknown_fields))}")
+
         test_mode = self.test_mode_var.get()
         test_email = self.test_email_var.get().strip() if test_mode else None
 
-        for idx, record in enumerate(pending_records):
-            if not self.is_sending_emails:
-                self.log_email("[STOP] Email sending stopped by user")
-                break
-
-            company = record['company']
-            person = record['person']
-            email = record['email']
-            attachment_path = Path(record['pdf_path'])
+        # One date string for the whole batch instead of two strftime calls
+        # per record (the templates only take a day-granularity date)
+        send_date = datetime.now().strftime('%Y-%m-%d')
+
+        self._stop_evt.clear()
+        self.log_email(f"[INFO] Sending with {EMAIL_SEND_WORKERS} parallel workers")
+
+        def update_maximum():
+            self.email_progress.configure(maximum=total)
+        self.root.after(0, update_maximum)
+
+        # Sending is I/O-bound (SMTP round-trips), so dispatch to a bounded
+        # thread pool and consume completions as they arrive. CSV/tracker
+        # writes stay in this single consumer thread to avoid contention.
+        with ThreadPoolExecutor(max_workers=EMAIL_SEND_WORKERS,
+                                initializer=self._init_email_worker) as executor:
+            futures = {
+                executor.submit(self._send_one, record, smtp_config,
+                                subject_template, body_template,
+                                test_mode, test_email, send_date): record
+                for record in pending_records
+            }
 
-            # Update current label
-            def update_current():
-                self.email_progress.configure(maximum=total)
-                self.email_current_label.config(text=f"Sending: {company} - {person}")
-            self.root.after(0, update_current)
+            done = 0
+            last_progress = 0.0
+            for future in as_completed(futures):
+                try:
+                    ok, record, error = future.result()
+                except Exception as e:
+                    ok, record, error = False, futures[future], str(e)
 
-            try:
-                self.log_email(f"[{idx+1}/{total}] [SEND] Sending to: {company} - {person}")
-                self.log_email(f"  Email address: {email if email else 'NO EMAIL FOUND'}")
-                self.log_email(f"  PDF: {attachment_path.name}")
-
-                # Check if email exists - handle NaN/None/empty values
-                import pandas as pd
-                if pd.isna(email) or not email or (isinstance(email, str) and (email.strip() == "" or email == "NO EMAIL")):
-                    raise ValueError(f"No email address found for {company} - {person}")
-
-                # Format subject and body with template
-                self.log_email(f"  Formatting email...")
-                subject = subject_template.format(
-                    company=company,
-                    name=person,
-                    date=datetime.now().strftime('%Y-%m-%d')
-                )
+                if error == 'stopped':
+                    continue
 
-                body = body_template.format(
-                    company=company,
-                    name=person,
-                    date=datetime.now().strftime('%Y-%m-%d')
-                )
+                done += 1
+                company = record['company']
+                person = record['person']
 
-                # Determine recipient
-                recipient = test_email if test_mode else email
-                if test_mode:
-                    self.log_email(f"  [TEST MODE] Sending to: {recipient} (original: {email})")
-                    body = f"[TEST MODE]\nOriginal recipient: {email}\n\n" + body
+                if ok:
+                    sent_count += 1
+                    if not test_mode:
+                        self.mark_as_sent_in_csv(company, person)
+                        self.log_email(f"  Updated CSV: marked {company} - {person} as sent")
                 else:
-                    self.log_email(f"  [LIVE MODE] Sending to: {recipient}")
-
-                # Validate recipient before sending
-                if not recipient or '@' not in recipient:
-                    raise ValueError(f"Invalid recipient email address: {recipient}")
-
-                # Try Outlook first with priority account fallback, then SMTP
-                use_outlook = True
-                outlook_error = None
-
-                if use_outlook:
-                    try:
-                        self.log_email(f"  [OUTLOOK] Attempting to send via Outlook...")
-                        import win32com.client
-
-                        # Create Outlook instance
-                        outlook = win32com.client.Dispatch('Outlook.Application')
-
-                        # Define account priority list
-                        priority_accounts = [
-                            "info@resiliencescan.org",
-                            "r.deboer@windesheim.nl",
-                            "cg.verhoef@windesheim.nl"
-                        ]
-
-                        # Get all available accounts
-                        available_accounts = []
-                        try:
-                            for i in range(1, outlook.Session.Accounts.Count + 1):
-                                account = outlook.Session.Accounts.Item(i)
-                                available_accounts.append((account.SmtpAddress, account))
-                            self.log_email(f"  Found {len(available_accounts)} Outlook account(s)")
-                        except Exception as e:
-                            self.log_email(f"  [WARNING] Could not enumerate Outlook accounts: {e}")
-
-                        # Select account based on priority
-                        selected_account = None
-                        selected_address = None
-
-                        # Try priority accounts first
-                        for priority_email in priority_accounts:
-                            for smtp_address, account in available_accounts:
-                                if smtp_address.lower() == priority_email.lower():
-                                    selected_account = account
-                                    selected_address = smtp_address
-                                    self.log_email(f"  [OK] Using priority account: {selected_address}")
-                                    break
-                            if selected_account:
-                                break
-
-                        # If no priority account found, use any available account
-                        if not selected_account and available_accounts:
-                            selected_address, selected_account = available_accounts[0]
-                            self.log_email(f"  [INFO] No priority account available, using: {selected_address}")
-
-                        # Create mail item
-                        mail = outlook.CreateItem(0)  # 0 = MailItem
-
-                        # Set email properties
-                        self.log_email(f"  Setting recipient to: {recipient}")
-                        mail.To = recipient
-                        mail.Subject = subject
-                        mail.Body = body
-
-                        # Set the sending account if we found one
-                        if selected_account:
-                            mail.SendUsingAccount = selected_account
-                            self.log_email(f"  [OK] Configured to send from: {selected_address}")
-                        else:
-                            self.log_email(f"  [WARNING] No specific account found, using Outlook default")
-
-                        # Add attachment
-                        self.log_email(f"  Attaching PDF: {attachment_path}...")
-                        mail.Attachments.Add(str(attachment_path.absolute()))
-
-                        # VERIFICATION: Log the actual recipient before sending
-                        self.log_email(f"  [OK] Email configured:")
-                        self.log_email(f"     To: {mail.To}")
-                        self.log_email(f"     From: {selected_address if selected_address else '(default account)'}")
-                        self.log_email(f"     Subject: {mail.Subject[:50]}...")
-
-                        # Send the email
-                        self.log_email(f"  [OUTLOOK] Sending via Outlook...")
-                        mail.Send()
-                        self.log_email(f"  [OK] Email sent successfully via Outlook from {selected_address if selected_address else 'default account'}!")
-
-                    except Exception as outlook_ex:
-                        outlook_error = str(outlook_ex)
-                        self.log_email(f"  [WARNING] Outlook failed: {outlook_error}")
-                        self.log_email(f"  [FALLBACK] Attempting SMTP as fallback...")
-
-                        # Fallback to SMTP
-                        import smtplib
-                        from email.mime.multipart import MIMEMultipart
-                        from email.mime.text import MIMEText
-                        from email.mime.base import MIMEBase
-                        from email import encoders
-
-                        # Create message
-                        self.log_email(f"  [SMTP] Creating SMTP message as final fallback...")
-                        self.log_email(f"  Setting recipient to: {recipient}")
-                        msg = MIMEMultipart()
-                        msg['From'] = smtp_from
-                        msg['To'] = recipient
-                        msg['Subject'] = subject
-
-                        # Add body
-                        msg.attach(MIMEText(body, 'plain'))
-
-                        # Add attachment
-                        self.log_email(f"  Attaching PDF...")
-                        with open(attachment_path, 'rb') as f:
-                            part = MIMEBase('application', 'octet-stream')
-                            part.set_payload(f.read())
-                            encoders.encode_base64(part)
-                            part.add_header('Content-Disposition', f'attachment; filename={attachment_path.name}')
-                            msg.attach(part)
-
-                        # Connect and send
-                        self.log_email(f"  [SMTP] Connecting to SMTP: {smtp_server}:{smtp_port}...")
-                        server = smtplib.SMTP(smtp_server, smtp_port)
-
-                        self.log_email(f"  [SMTP] Starting TLS...")
-                        server.starttls()
-
-                        self.log_email(f"  [SMTP] Logging in as: {smtp_username}...")
-                        server.login(smtp_username, smtp_password)
-
-                        self.log_email(f"  [SMTP] Sending message from {smtp_from}...")
-                        server.send_message(msg)
-
-                        self.log_email(f"  [SMTP] Closing connection...")
-                        server.quit()
-
-                        self.log_email(f"  [OK] Email sent successfully via SMTP from {smtp_from} (used as fallback after Outlook failed)!")
-                else:
-                    # Direct SMTP if Outlook disabled
-                    import smtplib
-                    from email.mime.multipart import MIMEMultipart
-                    from email.mime.text import MIMEText
-                    from email.mime.base import MIMEBase
-                    from email import encoders
-
-                    msg = MIMEMultipart()
-                    msg['From'] = smtp_from
-                    msg['To'] = recipient
-                    msg['Subject'] = subject
-                    msg.attach(MIMEText(body, 'plain'))
-
-                    with open(attachment_path, 'rb') as f:
-                        part = MIMEBase('application', 'octet-stream')
-                        part.set_payload(f.read())
-                        encoders.encode_base64(part)
-                        part.add_header('Content-Disposition', f'attachment; filename={attachment_path.name}')
-                        msg.attach(part)
-
-                    server = smtplib.SMTP(smtp_server, smtp_port)
-                    server.starttls()
-                    server.login(smtp_username, smtp_password)
-                    server.send_message(msg)
-                    server.quit()
-
-                # Mark as sent in CSV (ONLY if not in test mode)
-                if not test_mode:
-                    self.mark_as_sent_in_csv(company, person)
-                    self.log_email(f"  Updated CSV: marked as sent")
-                else:
-                    self.log_email(f"  Test mode: NOT updating CSV")
-
-                sent_count += 1
-                self.log_email(f"  [OK] SUCCESS: Email sent!")
-
-            except Exception as e:
-                failed_count += 1
-                error_msg = str(e)
-                self.log_email(f"  [ERROR] FAILED: {error_msg}")
-                self.log_email(f"  Error type: {type(e).__name__}")
-
-                # Log more details for common errors
-                import traceback
-                self.log_email(f"  Full error:\n{traceback.format_exc()}")
-
-            # Update progress
-            current_idx = idx + 1
-            def update_progress():
-                self.email_progress.configure(value=current_idx)
-                self.email_progress_label.config(
-                    text=f"Progress: {current_idx}/{total} | Sent: {sent_count} | Failed: {failed_count}"
-                )
-            self.root.after(0, update_progress)
-
-            # Update email status display after EVERY email (so you see it change in real-time)
-            if not test_mode:  # Only if we're actually updating the CSV
-                self.root.after(0, self.update_email_status_display)
+                    failed_count += 1
+                    self.log_email(f"  [ERROR] FAILED for {company} - {person}: {error}")
+
+                # Progress (and the status table) update at ~10 Hz on the
+                # main thread: Tk is not thread-safe, and a redraw per email
+                # would become the bottleneck once sends are fast.
+                now = time.monotonic()
+                if done == total or now - last_progress > 0.1:
+                    last_progress = now
+                    self.root.after(0, self._update_email_progress, done, total,
+                                    sent_count, failed_count, f"{company} - {person}")
+                    if not test_mode:  # Only if we're actually updating the CSV
+                        self.root.after(0, self.update_email_status_display)
+
+        if self._stop_evt.is_set():
+            self.log_email("[STOP] Email sending stopped by user")
+
+        # Make sure the last throttled tick reflects the final counts
+        self.root.after(0, self._update_email_progress, done, total,
+                        sent_count, failed_count, None)
 
         # Final updates
         def finalize():
@@ -3386,8 +4073,7 @@ TOP 10 MOST ENGAGED COMPANIES:
 
             # Reload data to get latest sent status
             try:
-                self.df = pd.read_csv(DATA_FILE)
-                self.df.columns = self.df.columns.str.lower().str.strip()
+                self._reload_data_file()
             except Exception as e:
                 self.log_email(f"[WARNING] Could not reload CSV: {e}")
 
@@ -3428,54 +4114,364 @@ TOP 10 MOST ENGAGED COMPANIES:
 
         self.log_email(f"\n[OK] Email distribution complete! Sent: {sent_count}, Failed: {failed_count}")
 
+    def _update_email_progress(self, done, total, sent, failed, who):
+        """Write email progress to the Tk widgets (main thread only)"""
+        if who is not None:
+            self.email_current_label.config(text=f"Sent: {who}")
+        self.email_progress.configure(value=done)
+        self.email_progress_label.config(
+            text=f"Progress: {done}/{total} | Sent: {sent} | Failed: {failed}"
+        )
+
+    @staticmethod
+    def _init_email_worker():
+        """Initialize COM for an email worker thread (needed for Outlook)"""
+        try:
+            import pythoncom
+            pythoncom.CoInitialize()
+        except ImportError:
+            pass
+
+    # Reconnect an SMTP session after this many messages (provider caps)
+    SMTP_SESSION_LIMIT = 50
+
+    def _get_smtp(self, smtp_config):
+        """Logged-in SMTP session for the calling worker thread.
+
+        The TLS handshake and AUTH cost more than a small message, so each
+        sender thread keeps one session and recycles it every
+        SMTP_SESSION_LIMIT messages to stay under provider session caps.
+        """
+        import smtplib
+        local = self._smtp_local
+        server = getattr(local, 'server', None)
+
+        if server is not None and local.session_sends >= self.SMTP_SESSION_LIMIT:
+            try:
+                server.quit()
+            except Exception:
+                pass
+            server = None
+
+        if server is None:
+            server = smtplib.SMTP(smtp_config['server'], smtp_config['port'])
+            server.starttls()
+            server.login(smtp_config['username'], smtp_config['password'])
+            local.server = server
+            local.session_sends = 0
+        return server
+
+    def _drop_smtp(self):
+        """Discard the calling thread's SMTP session (e.g. after an error)"""
+        server = getattr(self._smtp_local, 'server', None)
+        if server is not None:
+            try:
+                server.close()
+            except Exception:
+                pass
+            self._smtp_local.server = None
+
+    def _send_one(self, record, smtp_config, subject_template, body_template,
+                  test_mode, test_email, send_date):
+        """Send a single email (runs on a worker thread).
+
+        Returns (ok, record, error). Only logging happens here — CSV and
+        tracker updates are done by the consumer loop so there is a single
+        writer. Returns error='stopped' without sending when the stop event
+        is set.
+        """
+        if self._stop_evt.is_set():
+            return False, record, 'stopped'
+
+        company = record['company']
+        person = record['person']
+        email = record['email']
+        attachment_path = Path(record['pdf_path'])
+        who = f"{company} - {person}"
+
+        try:
+            self.log_email(f"[SEND] Sending to: {who}")
+            self.log_email(f"  [{who}] Email address: {email if email else 'NO EMAIL FOUND'}")
+            self.log_email(f"  [{who}] PDF: {attachment_path.name}")
+
+            # Check if email exists - handle NaN/None/empty values
+            import pandas as pd
+            if pd.isna(email) or not email or (isinstance(email, str) and (email.strip() == "" or email == "NO EMAIL")):
+                raise ValueError(f"No email address found for {who}")
+
+            # Format subject and body with template; one field dict feeds
+            # both, and unknown placeholders pass through instead of
+            # failing the whole send
+            fields = _SafeDict(company=company, name=person, date=send_date)
+            subject = subject_template.format_map(fields)
+            body = body_template.format_map(fields)
+
+            # Determine recipient
+            recipient = test_email if test_mode else email
+            if test_mode:
+                self.log_email(f"  [{who}] [TEST MODE] Sending to: {recipient} (original: {email})")
+                body = f"[TEST MODE]\nOriginal recipient: {email}\n\n" + body
+            else:
+                self.log_email(f"  [{who}] [LIVE MODE] Sending to: {recipient}")
+
+            # Validate recipient before sending
+            if not recipient or '@' not in recipient:
+                raise ValueError(f"Invalid recipient email address: {recipient}")
+
+            # Try Outlook first with priority account fallback, then SMTP
+            try:
+                self.log_email(f"  [{who}] [OUTLOOK] Attempting to send via Outlook...")
+                import win32com.client
+
+                # Create Outlook instance
+                outlook = win32com.client.Dispatch('Outlook.Application')
+
+                # Define account priority list
+                priority_accounts = [
+                    "info@resiliencescan.org",
+                    "r.deboer@windesheim.nl",
+                    "cg.verhoef@windesheim.nl"
+                ]
+
+                # Get all available accounts
+                available_accounts = []
+                try:
+                    for i in range(1, outlook.Session.Accounts.Count + 1):
+                        account = outlook.Session.Accounts.Item(i)
+                        available_accounts.append((account.SmtpAddress, account))
+                except Exception as e:
+                    self.log_email(f"  [{who}] [WARNING] Could not enumerate Outlook accounts: {e}")
+
+                # Select account based on priority
+                selected_account = None
+                selected_address = None
+
+                # Try priority accounts first
+                for priority_email in priority_accounts:
+                    for smtp_address, account in available_accounts:
+                        if smtp_address.lower() == priority_email.lower():
+                            selected_account = account
+                            selected_address = smtp_address
+                            break
+                    if selected_account:
+                        break
+
+                # If no priority account found, use any available account
+                if not selected_account and available_accounts:
+                    selected_address, selected_account = available_accounts[0]
+
+                # Create mail item
+                mail = outlook.CreateItem(0)  # 0 = MailItem
+                mail.To = recipient
+                mail.Subject = subject
+                mail.Body = body
+
+                # Set the sending account if we found one
+                if selected_account:
+                    mail.SendUsingAccount = selected_account
+
+                # Add attachment
+                mail.Attachments.Add(str(attachment_path.absolute()))
+
+                # Send the email
+                mail.Send()
+                self.log_email(f"  [{who}] [OK] Sent via Outlook from {selected_address if selected_address else 'default account'}")
+
+            except Exception as outlook_ex:
+                self.log_email(f"  [{who}] [WARNING] Outlook failed: {outlook_ex}")
+                self.log_email(f"  [{who}] [FALLBACK] Attempting SMTP as fallback...")
+
+                # Fallback to SMTP
+                from email.mime.multipart import MIMEMultipart
+                from email.mime.text import MIMEText
+                from email.mime.base import MIMEBase
+
+                # Create message
+                msg = MIMEMultipart()
+                msg['From'] = smtp_config['from']
+                msg['To'] = recipient
+                msg['Subject'] = subject
+
+                # Add body
+                msg.attach(MIMEText(body, 'plain'))
+
+                # Add attachment (payload pre-encoded and cached per file)
+                part = MIMEBase('application', 'octet-stream')
+                part.set_payload(_encoded_pdf_payload(str(attachment_path),
+                                                      attachment_path.stat().st_mtime_ns))
+                part.add_header('Content-Transfer-Encoding', 'base64')
+                part.add_header('Content-Disposition', f'attachment; filename={attachment_path.name}')
+                msg.attach(part)
+
+                # Send over this worker's persistent session; a failed send
+                # drops the session so the next attempt reconnects cleanly
+                try:
+                    server = self._get_smtp(smtp_config)
+                    server.send_message(msg)
+                    self._smtp_local.session_sends += 1
+                except Exception:
+                    self._drop_smtp()
+                    raise
+
+                self.log_email(f"  [{who}] [OK] Sent via SMTP from {smtp_config['from']} (fallback after Outlook failed)")
+
+            return True, record, None
+
+        except Exception as e:
+            import traceback
+            self.log_email(f"  [{who}] Full error:\n{traceback.format_exc()}")
+            return False, record, str(e)
+
     def stop_email(self):
         """Stop email sending"""
         if messagebox.askyesno("Confirm", "Stop email sending?"):
             self.is_sending_emails = False
+            self._stop_evt.set()
 
     # ==================== Logging Methods ====================
 
-    def log(self, message):
-        """Log to system log"""
-        timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        log_message = f"[{timestamp}] {message}\n"
+    def _log_timestamps(self):
+        """Log-line timestamps, reformatted at most once per second.
 
-        self.system_log.insert(tk.END, log_message)
-        self.system_log.see(tk.END)
+        strftime per message adds up in the tight generation/email loops,
+        and log lines never need sub-second resolution. The refresh race
+        between threads is benign: both write identical strings.
+        """
+        now = int(time.time())
+        if now != self._ts_second:
+            self._ts_full = time.strftime('%Y-%m-%d %H:%M:%S', time.localtime(now))
+            self._ts_short = self._ts_full[11:]
+            self._ts_second = now
+        return self._ts_full, self._ts_short
 
-        # Write to file
-        try:
-            with open(LOG_FILE, 'a') as f:
-                f.write(log_message)
-        except:
-            pass
+    def log(self, message):
+        """Log to system log (thread-safe; lines are drained in batches)"""
+        timestamp, _ = self._log_timestamps()
+        self._log_queue.put(('system', f"[{timestamp}] {message}\n"))
 
     def log_gen(self, message):
-        """Log to generation log"""
-        timestamp = datetime.now().strftime("%H:%M:%S")
-        log_message = f"[{timestamp}] {message}\n"
-
-        self.gen_log.insert(tk.END, log_message)
-        self.gen_log.see(tk.END)
+        """Log to generation log (thread-safe)"""
+        _, timestamp = self._log_timestamps()
+        self._log_queue.put(('gen', f"[{timestamp}] {message}\n"))
         self.log(message)
 
     def log_email(self, message):
-        """Log to email log"""
-        timestamp = datetime.now().strftime("%H:%M:%S")
-        log_message = f"[{timestamp}] {message}\n"
-
-        self.email_log.insert(tk.END, log_message)
-        self.email_log.see(tk.END)
+        """Log to email log (thread-safe)"""
+        _, timestamp = self._log_timestamps()
+        self._log_queue.put(('email', f"[{timestamp}] {message}\n"))
         self.log(message)
 
+    def _log_file_writer(self):
+        """Daemon consumer that appends queued log lines to LOG_FILE.
+
+        Keeps one persistent buffered handle instead of reopening the file
+        per message, and flushes when the queue goes idle so bursts cost
+        one buffered write per line and at most one flush. Reopens the
+        handle if the log file is cleared from the Logs tab.
+        """
+        f = None
+        while True:
+            try:
+                line = self._log_file_queue.get(timeout=1)
+            except queue.Empty:
+                if f is not None:
+                    try:
+                        f.flush()
+                    except OSError:
+                        pass
+                continue
+
+            try:
+                if f is None or not LOG_FILE.exists():
+                    if f is not None:
+                        f.close()
+                    f = open(LOG_FILE, 'a', buffering=8192)
+                f.write(line)
+                # Flush at the end of each burst, not per line, so a
+                # Refresh right after one sees the latest lines
+                if self._log_file_queue.empty():
+                    f.flush()
+            except OSError:
+                f = None
+
+    def _drain_log_queue(self):
+        """Flush queued log lines, one Text insert per widget per tick.
+
+        Runs every 20 ms on the Tk main thread, so worker threads never
+        touch widgets directly and a burst of log lines costs one redraw
+        instead of one per line. The queue is drained fully each tick, so
+        bursts never back up behind the poll interval. The system log is
+        mirrored to LOG_FILE in the same batch.
+        """
+        file_lines = []
+        while True:
+            try:
+                dest, line = self._log_queue.get_nowait()
+            except queue.Empty:
+                break
+            self._pending_log_lines[dest].append(line)
+            if dest == 'system':
+                file_lines.append(line)
+
+        # The file mirror happens regardless of whether the Logs tab exists;
+        # the writer thread owns the actual disk I/O
+        for line in file_lines:
+            self._log_file_queue.put(line)
+
+        # Widgets for lazily-built tabs may not exist yet; their lines stay
+        # buffered (bounded) until the tab is created.
+        widget_attrs = {'system': 'system_log', 'gen': 'gen_log', 'email': 'email_log'}
+        for dest, lines in self._pending_log_lines.items():
+            if not lines:
+                continue
+
+            widget = getattr(self, widget_attrs[dest], None)
+            if widget is None:
+                del lines[:-MAX_LOG_LINES]
+                continue
+
+            widget.insert(tk.END, ''.join(lines))
+            lines.clear()
+
+            # Trim to a bounded window of recent lines
+            line_count = int(widget.index('end-1c').split('.')[0])
+            if line_count > MAX_LOG_LINES:
+                widget.delete('1.0', f'{line_count - MAX_LOG_LINES}.0')
+
+            widget.see(tk.END)
+
+        # The status-bar clock shares this heartbeat: refresh it every 50th
+        # tick (once a second) instead of running a second after() loop.
+        self._drain_tick = getattr(self, '_drain_tick', 0) + 1
+        if self._drain_tick % 50 == 0:
+            self.update_time()
+
+        self.root.after(20, self._drain_log_queue)
+
     def refresh_logs(self):
-        """Refresh system logs"""
-        self.system_log.delete('1.0', tk.END)
+        """Refresh system logs (bounded: reload only the file's tail).
+
+        The widget is also fed live by _drain_log_queue, so an
+        append-the-delta refresh would re-insert lines the drain loop
+        already displayed; clearing and reloading the capped tail keeps
+        the read bounded without duplicating anything.
+        """
         try:
-            if LOG_FILE.exists():
-                with open(LOG_FILE, 'r') as f:
-                    self.system_log.insert('1.0', f.read())
-                self.system_log.see(tk.END)
+            if not LOG_FILE.exists():
+                return
+
+            size = LOG_FILE.stat().st_size
+            with open(LOG_FILE, 'rb') as f:
+                start = max(0, size - LOG_TAIL_BYTES)
+                f.seek(start)
+                data = f.read()
+                if start > 0:
+                    # Drop the partial first line
+                    data = data.split(b'\n', 1)[-1]
+
+            self.system_log.delete('1.0', tk.END)
+            self.system_log.insert('1.0', data.decode('utf-8', errors='replace'))
+            self.system_log.see(tk.END)
         except Exception as e:
             self.log(f"Error loading log file: {e}")
 
@@ -3513,12 +4509,33 @@ TOP 10 MOST ENGAGED COMPANIES:
 
     # ==================== Utility Methods ====================
 
+    def _count_reports(self):
+        """Count PDFs in the reports folder, cached on the directory mtime.
+
+        The directory mtime bumps whenever an entry is added or removed, so
+        the cached count invalidates itself without re-statting every PDF
+        on each dashboard refresh.
+        """
+        if not REPORTS_DIR.exists():
+            return 0
+
+        mt = REPORTS_DIR.stat().st_mtime_ns
+        if mt != self._pdf_count_cache[0]:
+            count = sum(1 for p in REPORTS_DIR.iterdir() if p.suffix == '.pdf')
+            self._pdf_count_cache = (mt, count)
+        return self._pdf_count_cache[1]
+
+    def _save_stats_cache(self):
+        """Persist the stats dict so the next startup paints instantly"""
+        try:
+            STATS_CACHE_FILE.write_text(json.dumps(self.stats))
+        except OSError:
+            pass
+
     def update_stats_display(self):
         """Update statistics in header"""
         # Count actual reports in reports directory
-        if REPORTS_DIR.exists():
-            reports = list(REPORTS_DIR.glob("*.pdf"))
-            self.stats['reports_generated'] = len(reports)
+        self.stats['reports_generated'] = self._count_reports()
 
         self.stats_labels['respondents'].config(text=str(self.stats['total_respondents']))
         self.stats_labels['companies'].config(text=str(self.stats['total_companies']))
@@ -3526,10 +4543,9 @@ TOP 10 MOST ENGAGED COMPANIES:
         self.stats_labels['emails'].config(text=str(self.stats['emails_sent']))
 
     def update_time(self):
-        """Update time in status bar"""
-        current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        """Update time in status bar (driven by the drain-loop heartbeat)"""
+        current_time, _ = self._log_timestamps()
         self.status_time_label.config(text=current_time)
-        self.root.after(1000, self.update_time)
 
     def show_about(self):
         """Show about dialog"""
@@ -3552,11 +4568,24 @@ Hogeschool Windesheim
 
     def analyze_data_quality(self):
         """Automatically analyze and display basic data quality metrics"""
+        # The Data tab is built lazily; nothing to display until then
+        if not hasattr(self, 'quality_text'):
+            return
+
         if self.df is None or len(self.df) == 0:
             self.quality_text.delete('1.0', tk.END)
             self.quality_text.insert('1.0', "No data loaded.")
             return
 
+        # The metrics only change when the frame does, so recompute once
+        # per loaded DataFrame and just re-render the cached summary on
+        # tab switches and preview refreshes (the out-of-range pass alone
+        # runs to_numeric over 15 columns).
+        if self._quality_cache_df is self.df and self._quality_cache is not None:
+            self.quality_text.delete('1.0', tk.END)
+            self.quality_text.insert('1.0', self._quality_cache)
+            return
+
         try:
             # Score columns
             score_cols = [
@@ -3601,6 +4630,9 @@ Quality Status: {'[OK] Good' if missing_pct < 5 and out_of_range == 0 else '[WAR
 
 Click 'Run Quality Dashboard' for detailed analysis with visualizations."""
 
+            self._quality_cache = quality_summary
+            self._quality_cache_df = self.df
+
             self.quality_text.delete('1.0', tk.END)
             self.quality_text.insert('1.0', quality_summary)
 
@@ -3712,7 +4744,10 @@ def main():
     """Main entry point"""
     root = tk.Tk()
     app = ResilienceScanGUI(root)
-    root.mainloop()
+    try:
+        root.mainloop()
+    finally:
+        app.shutdown_workers()
 
 
 if __name__ == "__main__":
@@ -17,14 +17,37 @@ class EmailTracker:
     def __init__(self, db_path="email_tracking.db"):
         self.db_path = Path(db_path)
         self.thread_local = threading.local()
+        # Results only change on writes, so get_statistics() and
+        # get_all_records() memoize until the next write invalidates them
+        self._stats_cache = None
+        self._records_cache = {}
         self.init_database()
 
     def get_connection(self):
         """Get a thread-local database connection"""
         if not hasattr(self.thread_local, 'conn') or self.thread_local.conn is None:
-            self.thread_local.conn = sqlite3.connect(str(self.db_path), check_same_thread=False)
+            conn = sqlite3.connect(str(self.db_path), check_same_thread=False)
+            # WAL lets readers proceed while a writer commits, and NORMAL
+            # avoids an fsync per transaction (safe under WAL)
+            conn.execute('PRAGMA journal_mode=WAL')
+            conn.execute('PRAGMA synchronous=NORMAL')
+            self.thread_local.conn = conn
         return self.thread_local.conn
 
+    def begin(self):
+        """Open an explicit transaction so bulk updates commit once"""
+        self.get_connection().execute('BEGIN')
+
+    def commit(self):
+        """Commit the current transaction"""
+        self.get_connection().commit()
+        self._invalidate_caches()
+
+    def _invalidate_caches(self):
+        """Drop memoized query results after a write"""
+        self._stats_cache = None
+        self._records_cache = {}
+
     def init_database(self):
         """Initialize the database"""
         conn = sqlite3.connect(str(self.db_path))
@@ -98,6 +121,8 @@ class EmailTracker:
                 skipped += 1
 
         self.get_connection().commit()
+        if imported:
+            self._invalidate_caches()
         return imported, skipped
 
     def mark_as_sent(self, company, person, email, report_filename,
@@ -122,6 +147,7 @@ class EmailTracker:
               error, company, person, email))
 
         self.get_connection().commit()
+        self._invalidate_caches()
         return cursor.rowcount > 0
 
     def manually_update_status(self, record_id, new_status, notes=""):
@@ -138,6 +164,7 @@ class EmailTracker:
         ''', (new_status, notes, datetime.now().isoformat(), record_id))
 
         self.get_connection().commit()
+        self._invalidate_caches()
         return cursor.rowcount > 0
 
     def check_if_sent(self, company, person, email):
@@ -206,7 +233,12 @@ class EmailTracker:
         return pd.DataFrame(results, columns=columns) if results else pd.DataFrame(columns=columns)
 
     def get_all_records(self, status=None):
-        """Get all email records as list of dictionaries"""
+        """Get all email records as list of dictionaries (cached until the next write)"""
+        cached = self._records_cache.get(status)
+        if cached is not None:
+            # Shallow copies so callers can mutate their rows safely
+            return [dict(row) for row in cached]
+
         cursor = self.get_connection().cursor()
 
         if status:
@@ -235,6 +267,7 @@ class EmailTracker:
         for row in cursor.fetchall():
             results.append(dict(zip(columns, row)))
 
+        self._records_cache[status] = [dict(row) for row in results]
         return results
 
     def get_record_by_details(self, company_name, person_name, email_address):
@@ -258,7 +291,10 @@ class EmailTracker:
         return None
 
     def get_statistics(self):
-        """Get email sending statistics"""
+        """Get email sending statistics (cached until the next write)"""
+        if self._stats_cache is not None:
+            return dict(self._stats_cache)
+
         cursor = self.get_connection().cursor()
 
         # Initialize with defaults
@@ -303,6 +339,7 @@ class EmailTracker:
         ''')
         stats['manually_updated'] = cursor.fetchone()[0]
 
+        self._stats_cache = dict(stats)
         return stats
 
     def reset_status(self, record_id):
@@ -327,6 +364,8 @@ class EmailTracker:
             updated += cursor.rowcount
 
         self.get_connection().commit()
+        if updated:
+            self._invalidate_caches()
         return updated
 
     def export_to_csv(self, output_path):